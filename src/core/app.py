@@ -12,7 +12,7 @@ from .managers.button_manager import ButtonManager
 from .managers.timer_manager import TimerManager
 from .managers.minimal_mode_manager import MinimalModeManager
 from .managers.button_actions_manager import ButtonActionsManager
-from .managers.settings_manager import SettingsManager
+from .managers.settings_manager import SettingsManager, _LEVEL_MAP
 from .managers.music_manager import MusicManager
 
 from src.ui.themes import load_themes
@@ -186,15 +186,8 @@ class QuickButtonsApp(tk.Tk):
         """Apply the specified logging level."""
         import logging
         from src.utils.logger import update_log_level
-        
-        level_map = {
-            "ERROR": logging.ERROR,
-            "WARNING": logging.WARNING,
-            "INFO": logging.INFO,
-            "DEBUG": logging.DEBUG
-        }
-        
-        level = level_map.get(level_name.upper(), logging.WARNING)
+
+        level = _LEVEL_MAP.get(level_name.upper(), logging.WARNING)
         update_log_level(level)
         logger.info(f"Logging level changed to: {level_name}")
     
@@ -329,6 +322,10 @@ class QuickButtonsApp(tk.Tk):
             delattr(self, 'resize_start_height')
         
         self.unregister_global_hotkeys()
+        
+        # A debounced config write may still be pending; the save below covers it
+        if hasattr(self, 'settings_manager'):
+            self.settings_manager.cancel_pending_save()
         self.save_config()
         logger.info("Application closing")
         self.destroy() 
\ No newline at end of file
@@ -1,18 +1,27 @@
-"""Button type handlers package."""
-
-from .python_script_handler import PythonScriptHandler
-from .website_handler import WebsiteHandler
-from .music_handler import MusicHandler
-from .post_handler import PostHandler
-from .shell_handler import ShellHandler
-from .llm_handler import LLMHandler
-from .app_launcher_handler import AppLauncherHandler
-from .network_speed_handler import NetworkSpeedHandler
-from .ping_handler import PingHandler
-from .pomodoro_handler import PomodoroHandler
-from .http_test_handler import HTTPTestHandler
-from .color_picker_handler import ColorPickerHandler
-from .button_handler_factory import ButtonHandlerFactory
+"""Button type handlers package.
+
+Handlers are imported on first attribute access (PEP 562); importing the
+package, e.g. for the factory, does not load every handler and its
+dependencies.
+"""
+
+import importlib
+
+_HANDLER_MODULES = {
+    'PythonScriptHandler': '.python_script_handler',
+    'WebsiteHandler': '.website_handler',
+    'MusicHandler': '.music_handler',
+    'PostHandler': '.post_handler',
+    'ShellHandler': '.shell_handler',
+    'LLMHandler': '.llm_handler',
+    'AppLauncherHandler': '.app_launcher_handler',
+    'NetworkSpeedHandler': '.network_speed_handler',
+    'PingHandler': '.ping_handler',
+    'PomodoroHandler': '.pomodoro_handler',
+    'HTTPTestHandler': '.http_test_handler',
+    'ColorPickerHandler': '.color_picker_handler',
+    'ButtonHandlerFactory': '.button_handler_factory',
+}
 
 __all__ = [
     'PythonScriptHandler',
@@ -28,4 +37,17 @@ __all__ = [
     'HTTPTestHandler',
     'ColorPickerHandler',
     'ButtonHandlerFactory'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
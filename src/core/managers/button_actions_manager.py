@@ -2,7 +2,6 @@
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from src.ui.dialogs import ButtonSettingsDialog
 from src.utils.logger import logger
 
 
@@ -19,6 +18,8 @@ class ButtonActionsManager:
             self.button_settings_dialog.lift()
             return
         
+        # Imported on first use so app startup does not load the dialog module
+        from src.ui.dialogs import ButtonSettingsDialog
         self.button_settings_dialog = ButtonSettingsDialog(self.app, self.app.theme, None, self._on_button_save, False)
         self.button_settings_dialog.protocol("WM_DELETE_WINDOW", self._on_button_close)
     
@@ -30,6 +31,7 @@ class ButtonActionsManager:
         
         # Store the original config for comparison
         self.original_config = btn_cfg.copy()
+        from src.ui.dialogs import ButtonSettingsDialog
         self.button_settings_dialog = ButtonSettingsDialog(self.app, self.app.theme, btn_cfg, self._on_button_save, True)
         self.button_settings_dialog.protocol("WM_DELETE_WINDOW", self._on_button_close)
     
@@ -51,7 +53,7 @@ class ButtonActionsManager:
             self.app.config_data["buttons"].append(button_config)
             logger.info(f"Added new button: {button_config.get('label', 'Unknown')}")
         
-        self.app.save_config()
+        self.app.settings_manager.schedule_save()
         self.app.button_manager.refresh_grid()
         self._on_button_close()
     
@@ -26,7 +26,6 @@ pygame = None
 from src.ui.components.tooltip import Tooltip
 from src.utils.logger import logger
 from src.utils.system import get_python_executable
-from src.ui.dialogs import OutputOverlay, LLMChatOverlay
 from .timer_manager import TimerManager
 from src.core.button_types.button_handler_factory import ButtonHandlerFactory
 
@@ -37,6 +36,9 @@ try:
 except ImportError:
     HAS_KEYBOARD = False
 
+# Button types whose handlers draw their own (often stateful) label text
+_SELF_LABELLED_TYPES = {"timer", "network_speed", "ping", "pomodoro", "http_test", "color_picker"}
+
 
 class ButtonManager:
     """Handles button creation, grid management, and button actions."""
@@ -350,6 +352,22 @@ class ButtonManager:
         self._on_grid_configure()
         logger.info(f"Grid refreshed: {n} buttons in {per_row} columns, cell_width={cell_width}")
     
+    def relabel(self):
+        """Re-apply button labels and default tooltips without rebuilding the grid."""
+        btns = self.app.config_data.get("buttons", [])
+        # Special button types manage their own text, rebuild those instead
+        if len(btns) != len(self.button_widgets) or any(cfg.get("type") in _SELF_LABELLED_TYPES for cfg in btns):
+            self.refresh_grid()
+            return
+        
+        for btn_cfg, btn in zip(btns, self.button_widgets):
+            label = btn_cfg.get("label", "Run Script")
+            btn.config(text=label)
+            tooltip = getattr(btn, "tooltip", None)
+            if tooltip is not None and not btn_cfg.get("tooltip", "").strip():
+                tooltip.text = self.app._("Run") + f" {label}"
+        logger.info(f"Grid relabeled: {len(btns)} buttons")
+    
     def _ensure_timer_manager_loaded(self):
         """Ensure timer manager is loaded when needed."""
         if self.timer_manager is None:
@@ -500,7 +518,7 @@ class ButtonManager:
             else:
                 # Default tooltip: "Run {button name}"
                 tooltip_text = self.app._("Run") + f" {label}"
-            Tooltip(btn, tooltip_text)
+            btn.tooltip = Tooltip(btn, tooltip_text)
             
             if cfg.get("shortcut"):
                 Tooltip(btn, f"Shortcut: {cfg['shortcut']}")
@@ -1,9 +1,23 @@
 """Settings management functionality for QuickButtons."""
 
+import logging
 import tkinter as tk
 import sys
-from src.ui.dialogs import SettingsDialog, AboutDialog
-from src.utils.logger import logger
+from src.ui.components.tooltip import Tooltip
+from src.utils.logger import logger, update_log_level
+
+_LEVEL_MAP = {
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG
+}
+
+# Config keys whose change affects what is drawn on screen
+_VISUAL_KEYS = ("language", "translucency", "min_btn_width", "max_btn_width",
+                "min_btn_height", "max_btn_height", "minimal_mode")
+# Config keys whose change requires the button grid to be rebuilt
+_GRID_KEYS = {"min_btn_width", "max_btn_width", "min_btn_height", "max_btn_height", "minimal_mode"}
 
 
 class SettingsManager:
@@ -13,22 +27,27 @@ class SettingsManager:
         self.app = app
         self.settings_dialog = None
         self.about_dialog = None
+        self._save_pending = None
+        # Name of the theme last pushed to the widget tree by update_theme
+        self._applied_theme_name = None
     
     def open_settings(self):
         """Open the settings dialog, only one at a time."""
         if self.settings_dialog is not None and self.settings_dialog.winfo_exists():
             self.settings_dialog.lift()
             return
+        # Imported on first use so app startup does not load the dialog module
+        from src.ui.dialogs import SettingsDialog
         self.settings_dialog = SettingsDialog(self.app, self.app.theme, self.app.config_data, self.save_settings)
         self.settings_dialog.protocol("WM_DELETE_WINDOW", self._on_settings_close)
     
     def save_settings(self, new_settings):
         """Save settings from the settings dialog and apply them."""
+        # Snapshot visual settings so only the affected parts of the UI get refreshed
+        old = {k: self.app.config_data.get(k) for k in _VISUAL_KEYS}
+        
         self.app.config_data["translucency"] = new_settings["translucency"]
-        language_changed = False
         if "language" in new_settings:
-            if self.app.config_data.get("language") != new_settings["language"]:
-                language_changed = True
             self.app.config_data["language"] = new_settings["language"]
         if "volume" in new_settings:
             self.app.config_data["volume"] = new_settings["volume"]
@@ -56,20 +75,45 @@ class SettingsManager:
             self.app.config_data["python_executable"] = new_settings["python_executable"]
             logger.info(f"Python executable saved to config: '{new_settings['python_executable']}'")
         
-        self.app.save_config()
-        self.app.apply_settings()
-        self.app.update_theme()
-        self.app.button_manager.refresh_grid()
+        changed = {k for k in _VISUAL_KEYS if self.app.config_data.get(k) != old[k]}
         
-        if language_changed:
-            self.app.translation_manager.set_language(new_settings["language"])
+        self.schedule_save()
+        
+        if "translucency" in changed:
+            self.app.attributes("-alpha", self.app.config_data.get("translucency", 1.0))
+        
+        # Switch language before rebuilding so new labels and tooltips are translated
+        if "language" in changed:
+            self.app.translation_manager.set_language(self.app.config_data["language"])
             self.app.update_topbar_tooltips()
         
+        if changed & _GRID_KEYS:
+            self.app.button_manager.refresh_grid()
+        elif "language" in changed:
+            self.app.button_manager.relabel()
+        
         # Apply minimal mode and force refresh if needed
-        self.app.apply_minimal_mode()
-        if "minimal_mode" in new_settings:
+        if "minimal_mode" in changed:
+            self.app.apply_minimal_mode()
             self.app.after(200, self.app.force_refresh_minimal_mode)
     
+    def schedule_save(self):
+        """Debounce config writes so rapid successive saves hit the disk once."""
+        if self._save_pending is not None:
+            self.app.after_cancel(self._save_pending)
+        self._save_pending = self.app.after(250, self._flush_save)
+    
+    def _flush_save(self):
+        """Write the config to disk."""
+        self._save_pending = None
+        self.app.save_config()
+    
+    def cancel_pending_save(self):
+        """Cancel a scheduled config write (the caller is responsible for saving)."""
+        if self._save_pending is not None:
+            self.app.after_cancel(self._save_pending)
+            self._save_pending = None
+    
     def apply_settings(self):
         """Apply settings such as button size and translucency."""
         self.app.attributes("-alpha", self.app.config_data.get("translucency", 1.0))
@@ -86,6 +130,7 @@ class SettingsManager:
         if self.about_dialog is not None and self.about_dialog.winfo_exists():
             self.about_dialog.lift()
             return
+        from src.ui.dialogs import AboutDialog
         self.about_dialog = AboutDialog(self.app, self.app.theme)
         self.about_dialog.protocol("WM_DELETE_WINDOW", self._on_about_close)
     
@@ -97,26 +142,27 @@ class SettingsManager:
     
     def _apply_log_level(self, level_name):
         """Apply the specified logging level."""
-        import logging
-        from src.utils.logger import update_log_level
-        
-        level_map = {
-            "ERROR": logging.ERROR,
-            "WARNING": logging.WARNING,
-            "INFO": logging.INFO,
-            "DEBUG": logging.DEBUG
-        }
-        
-        level = level_map.get(level_name.upper(), logging.WARNING)
+        level = _LEVEL_MAP.get(level_name.upper(), logging.WARNING)
         update_log_level(level)
         logger.info(f"Logging level changed to: {level_name}")
     
     def update_theme(self):
         """Update the application theme."""
-        self.app.theme_name = self.app.config_data.get("theme", self.app.detect_system_theme())
+        # toggle_theme sets app.theme_name before calling us, so compare against
+        # the theme we last applied rather than app.theme_name
+        new_theme_name = self.app.config_data.get("theme") or self.app.detect_system_theme()
+        if new_theme_name == self._applied_theme_name:
+            return
+        self._applied_theme_name = new_theme_name
+        self.app.theme_name = new_theme_name
         self.app.theme = self.app.themes[self.app.theme_name]
         self.app.configure(bg=self.app.theme["bg"])
-        self.app.topbar.config(bg=self.app.theme["topbar_bg"])
+        
+        # Let timer managers refresh their cached theme
+        for timer_manager in (getattr(self.app, "timer_manager", None), self.app.button_manager.timer_manager):
+            if timer_manager is not None:
+                timer_manager.on_theme_changed(self.app.theme)
+        Tooltip.refresh_colors()
         
         # Update grid canvas and frame through button manager
         if hasattr(self.app.button_manager, "grid_canvas"):
@@ -125,102 +171,20 @@ class SettingsManager:
             self.app.button_manager.grid_frame.config(bg=self.app.theme["bg"])
         
         # Update button colors for use_default_colors buttons
-        for idx, btn_cfg in enumerate(self.app.config_data.get("buttons", [])):
-            if idx < len(self.app.button_manager.button_widgets):
-                use_default = btn_cfg.get("use_default_colors", False)
-                if use_default:
-                    self.app.button_manager.button_widgets[idx].config(
-                        bg=self.app.theme["button_bg"], fg=self.app.theme["button_fg"], 
-                        activebackground=self.app.theme["button_hover"], 
-                        activeforeground=self.app.theme["button_fg"]
-                    )
-                    self.app.button_manager.button_widgets[idx].orig_bg = self.app.theme["button_bg"]
-                else:
-                    self.app.button_manager.button_widgets[idx].config(
-                        bg=btn_cfg.get("bg_color", self.app.theme["button_bg"]), 
-                        fg=btn_cfg.get("fg_color", self.app.theme["button_fg"]), 
-                        activebackground=self.app.theme["button_hover"], 
-                        activeforeground=self.app.theme["button_fg"]
-                    )
-                    self.app.button_manager.button_widgets[idx].orig_bg = btn_cfg.get("bg_color", self.app.theme["button_bg"])
-                
-                # Update hover bindings for timer buttons to use current theme
-                if btn_cfg.get("type") == "timer":
-                    # Remove old bindings and add new ones with current theme colors
-                    self.app.button_manager.button_widgets[idx].unbind("<Enter>")
-                    self.app.button_manager.button_widgets[idx].unbind("<Leave>")
-                    
-                    # Update orig_bg to current background color
-                    current_bg = self.app.button_manager.button_widgets[idx].cget("bg")
-                    self.app.button_manager.button_widgets[idx].orig_bg = current_bg
-                    
-                    # Update button colors if using default colors
-                    use_default = btn_cfg.get("use_default_colors", False)
-                    if use_default:
-                        self.app.button_manager.button_widgets[idx].config(
-                            bg=self.app.theme["button_bg"], fg=self.app.theme["button_fg"]
-                        )
-                        self.app.button_manager.button_widgets[idx].orig_bg = self.app.theme["button_bg"]
-                    
-                    # Create dynamic hover functions for timer buttons
-                    def on_timer_enter(event, button=self.app.button_manager.button_widgets[idx], config=btn_cfg):
-                        button.config(bg=self.app.theme["button_hover"])
-                    
-                    def on_timer_leave(event, button=self.app.button_manager.button_widgets[idx], config=btn_cfg):
-                        use_default = config.get("use_default_colors", False)
-                        if use_default:
-                            button.config(bg=self.app.theme["button_bg"])
-                        else:
-                            button.config(bg=button.orig_bg)
-                    
-                    self.app.button_manager.button_widgets[idx].bind("<Enter>", on_timer_enter)
-                    self.app.button_manager.button_widgets[idx].bind("<Leave>", on_timer_leave)
-        
-        # Update all toolbar buttons (only if they exist and we're not in minimal mode)
-        if not self.app.config_data.get("minimal_mode", False):
-            for btn in [self.app.add_btn, self.app.theme_btn, self.app.settings_btn, self.app.about_btn, self.app.pin_btn, self.app.file_add_btn]:
-                if btn and btn.winfo_exists():
-                    btn.config(
-                        bg=self.app.theme["topbar_bg"], fg=self.app.theme["button_fg"],
-                        activebackground=self.app.theme["button_hover"], activeforeground=self.app.theme["button_fg"]
-                    )
+        theme = self.app.theme
+        widgets = self.app.button_manager.button_widgets
+        for btn_cfg, btn in zip(self.app.config_data.get("buttons", []), widgets):
+            if btn_cfg.get("use_default_colors", False):
+                bg = theme["button_bg"]
+                fg = theme["button_fg"]
+            else:
+                bg = btn_cfg.get("bg_color", theme["button_bg"])
+                fg = btn_cfg.get("fg_color", theme["button_fg"])
+            btn.config(bg=bg, fg=fg, activebackground=theme["button_hover"], activeforeground=theme["button_fg"])
+            btn.orig_bg = bg
         
-        # Update minimal mode titlebar elements if in minimal mode
-        if self.app.config_data.get("minimal_mode", False):
-            # Update topbar background
-            self.app.topbar.config(bg=self.app.theme["topbar_bg"])
-            
-            # Update all widgets in the topbar
-            for widget in self.app.topbar.winfo_children():
-                if isinstance(widget, tk.Label):
-                    # Update logo and title labels
-                    widget.config(bg=self.app.theme["topbar_bg"], fg=self.app.theme["label_fg"])
-                elif isinstance(widget, tk.Button):
-                    # Update all buttons in the topbar
-                    if widget.cget("text") == "✕":  # Close button
-                        widget.config(bg=self.app.theme["topbar_bg"], fg=self.app.theme["label_fg"])
-                        # Update close button hover effects
-                        widget.unbind("<Enter>")
-                        widget.unbind("<Leave>")
-                        
-                        def on_close_enter(e, btn=widget):
-                            btn.config(bg="#e81123", fg="white")
-                        
-                        def on_close_leave(e, btn=widget):
-                            btn.config(bg=self.app.theme["topbar_bg"], fg=self.app.theme["label_fg"])
-                        
-                        widget.bind("<Enter>", on_close_enter)
-                        widget.bind("<Leave>", on_close_leave)
-                    else:
-                        widget.config(
-                            bg=self.app.theme["topbar_bg"], 
-                            fg=self.app.theme["button_fg"],
-                            activebackground=self.app.theme["button_hover"], 
-                            activeforeground=self.app.theme["button_fg"]
-                        )
-                elif isinstance(widget, tk.Frame):
-                    # Update spacer frame
-                    widget.config(bg=self.app.theme["topbar_bg"])
+        # Restyle the existing topbar widgets in place
+        self.app.topbar_manager.retheme()
         
         # Update scrollbars
         if hasattr(self.app.button_manager, 'grid_scrollbar') and self.app.button_manager.grid_scrollbar.winfo_exists():
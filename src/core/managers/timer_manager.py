@@ -1,5 +1,6 @@
 """Timer management functionality for QuickButtons."""
 
+import logging
 import tkinter as tk
 import re
 import time
@@ -10,11 +11,34 @@ from src.ui.components.tooltip import Tooltip
 from src.utils.logger import logger
 
 
+class _TimerState:
+    """Mutable countdown state shared by a timer button's callbacks."""
+    
+    __slots__ = ("running", "paused", "remaining", "job", "total", "end_time")
+    
+    def __init__(self, total):
+        self.running = False
+        self.paused = False
+        self.remaining = total
+        self.job = None
+        self.total = total
+        self.end_time = None
+
+
 class TimerManager:
     """Handles timer button functionality."""
     
     def __init__(self, app):
         self.app = app
+        # Shared references to avoid attribute chains on hot paths.
+        # config_data is mutated in place; the theme dict is replaced on theme
+        # change and refreshed through on_theme_changed().
+        self._cfg = app.config_data
+        self._theme = app.theme
+    
+    def on_theme_changed(self, theme):
+        """Refresh the cached theme after the application theme changed."""
+        self._theme = theme
     
     def create_timer_button(self, parent, cfg, font_size, cell_width):
         """Create a timer button with countdown functionality."""
@@ -30,21 +54,22 @@ class TimerManager:
         else:
             total_seconds = 60
         
-        state = {"running": False, "paused": False, "remaining": total_seconds, "job": None, "start_time": None}
+        st = _TimerState(total_seconds)
         
         # Get theme colors - respect use_default_colors setting
+        theme = self._theme
         use_default = cfg.get("use_default_colors", False)
         if use_default:
-            bg_color = self.app.theme["button_bg"]
-            fg_color = self.app.theme["button_fg"]
+            bg_color = theme["button_bg"]
+            fg_color = theme["button_fg"]
         else:
-            bg_color = cfg.get("bg_color", self.app.theme["button_bg"])
-            fg_color = cfg.get("fg_color", self.app.theme["button_fg"])
+            bg_color = cfg.get("bg_color", theme["button_bg"])
+            fg_color = cfg.get("fg_color", theme["button_fg"])
         
         btn = tk.Button(parent, text=btn_label, bg=bg_color, 
                        fg=fg_color, font=("Segoe UI", font_size), 
                        relief=tk.FLAT, bd=0, highlightthickness=0, 
-                       activebackground=self.app.theme["button_hover"], 
+                       activebackground=theme["button_hover"], 
                        activeforeground=fg_color, 
                        wraplength=cell_width-10, justify="center")
         btn.orig_bg = bg_color
@@ -57,37 +82,34 @@ class TimerManager:
         else:
             tooltip_text = user_tooltip
         
+        # Include the shortcut in the same tooltip so only one set of
+        # Enter/Leave handlers is bound per button
+        if cfg.get("shortcut"):
+            tooltip_text += f"\nShortcut: {cfg['shortcut']}"
+        
         # Create tooltip and store reference
-        logger.debug(f"Creating timer tooltip: '{tooltip_text}'")
         btn.tooltip = Tooltip(btn, tooltip_text)
-        logger.debug(f"Timer tooltip created, text property: '{btn.tooltip.text}'")
-        
-        # Add shortcut tooltip if configured
-        if cfg.get("shortcut"):
-            logger.debug(f"Creating timer shortcut tooltip: 'Shortcut: {cfg['shortcut']}'")
-            btn.shortcut_tooltip = Tooltip(btn, f"Shortcut: {cfg['shortcut']}")
-            logger.debug(f"Timer shortcut tooltip created, text property: '{btn.shortcut_tooltip.text}'")
         
         def update_label():
-            if state["running"]:
-                mins, secs = divmod(state["remaining"], 60)
+            if st.running:
+                mins, secs = divmod(st.remaining, 60)
                 hours, mins = divmod(mins, 60)
                 btn.config(text=f"{hours}:{mins:02}:{secs:02}")
             else:
                 btn.config(text=orig_label)
         
         def tick():
-            if not state["running"] or state["paused"]:
+            if not st.running or st.paused:
                 return
-            if state["remaining"] > 0:
-                state["remaining"] -= 1
+            if st.remaining > 0:
+                st.remaining -= 1
                 update_label()
-                state["job"] = btn.after(1000, tick)
+                st.job = btn.after(1000, tick)
             else:
-                state["running"] = False
+                st.running = False
                 update_label()
                 # Play sound
-                timer_sound = self.app.config_data.get("timer_sound", "")
+                timer_sound = self._cfg.get("timer_sound", "")
                 if timer_sound and os.path.isfile(timer_sound):
                     try:
                         self.app.music_player.play_music(timer_sound)
@@ -104,65 +126,59 @@ class TimerManager:
                         btn.bell()
         
         def start_timer():
-            if state["running"]:
+            if st.running:
                 return
-            state["running"] = True
-            state["paused"] = False
-            state["remaining"] = total_seconds
+            st.running = True
+            st.paused = False
+            st.remaining = st.total
             update_label()
             tick()
         
         def pause_resume_timer():
-            if not state["running"]:
+            if not st.running:
                 start_timer()
-            elif not state["paused"]:
-                state["paused"] = True
-                if state["job"]:
-                    btn.after_cancel(state["job"])
-                    state["job"] = None
+            elif not st.paused:
+                st.paused = True
+                if st.job:
+                    btn.after_cancel(st.job)
+                    st.job = None
                 update_label()
             else:
-                state["paused"] = False
+                st.paused = False
                 tick()
         
         def stop_timer():
-            state["running"] = False
-            state["paused"] = False
-            if state["job"]:
-                btn.after_cancel(state["job"])
-                state["job"] = None
-            state["remaining"] = total_seconds
+            st.running = False
+            st.paused = False
+            if st.job:
+                btn.after_cancel(st.job)
+                st.job = None
+            st.remaining = st.total
             update_label()
         
         def on_timer_click(event):
-            logger.debug(f"Timer button clicked: {cfg.get('label', 'Timer')}")
-            logger.debug(f"Animation enabled globally: {self.app.config_data.get('animation_enabled', True)}")
-            logger.debug(f"Animation disabled for button: {cfg.get('disable_animation', False)}")
+            anim_enabled = self._cfg.get("animation_enabled", True)
             
             # Execute timer action immediately to ensure double-click detection works
-            logger.debug("Executing timer action immediately")
             pause_resume_timer()
             
             # Add animation if enabled globally and not disabled for this button
-            if self.app.config_data.get("animation_enabled", True) and not cfg.get("disable_animation", False):
+            if anim_enabled and not cfg.get("disable_animation", False):
                 try:
                     from src.utils.animations import animate_button_press
-                    logger.debug("Timer animation module imported successfully")
                     
                     # Check if button uses default animation or custom animation
                     use_default_animation = cfg.get("use_default_animation", True)
                     if use_default_animation:
                         # Use global animation setting
-                        animation_type = self.app.config_data.get("default_animation_type", "ripple")
-                        logger.debug(f"Timer using global animation: {animation_type}")
+                        animation_type = self._cfg.get("default_animation_type", "ripple")
                     else:
                         # Use button-specific animation
                         animation_type = cfg.get("animation_type", "ripple")
-                        logger.debug(f"Timer using button-specific animation: {animation_type}")
                     
-                    logger.debug(f"Starting timer animation: {animation_type} at ({event.x}, {event.y})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Starting timer animation: {animation_type} at ({event.x}, {event.y})")
                     animate_button_press(event.widget, event.x, event.y, animation_type=animation_type)
-                    logger.debug("Timer animation started successfully")
                     
                 except Exception as e:
                     logger.warning(f"Timer animation failed: {e}")
@@ -172,7 +188,7 @@ class TimerManager:
         btn.bind("<Button-1>", on_timer_click)
         btn.bind("<Double-Button-1>", lambda e: stop_timer())
         btn.bind("<Button-3>", lambda e, i=cfg: self.app.edit_button(i))
-        btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.app.theme["button_hover"]), add="+")
+        btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self._theme["button_hover"]), add="+")
         btn.bind("<Leave>", lambda e, b=btn: b.config(bg=b.orig_bg), add="+")
         btn.image = None
         
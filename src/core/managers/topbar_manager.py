@@ -1,6 +1,7 @@
 """Topbar management functionality for QuickButtons."""
 
 import tkinter as tk
+import tkinter.font as tkfont
 from src.ui.components.tooltip import Tooltip
 from src.utils.logger import logger
 
@@ -10,103 +11,139 @@ class TopbarManager:
     
     def __init__(self, app):
         self.app = app
+        # Rarely used buttons (file add, settings, about) are built on demand
+        self._rest_built = False
+        self._rest_bind_id = None
+        self._btn_font = None
+    
+    def _t(self, text):
+        """Return the translated text for the current language."""
+        return self.app.translation_manager.get_text(text)
+    
+    def _button_kwargs(self):
+        """Return the widget options shared by all topbar buttons."""
+        if self._btn_font is None:
+            self._btn_font = tkfont.Font(family="Segoe UI", size=9)
+        theme = self.app.theme
+        tbg, bfg, bhv = theme["topbar_bg"], theme["button_fg"], theme["button_hover"]
+        return dict(bg=tbg, fg=bfg, font=self._btn_font, relief=tk.FLAT, bd=0, highlightthickness=0,
+                    activebackground=bhv, activeforeground=bfg)
+    
+    def _on_btn_enter(self, event):
+        """Highlight a topbar button under the pointer."""
+        event.widget.config(bg=self.app.theme["button_hover"])
+    
+    def _on_btn_leave(self, event):
+        """Restore a topbar button's background."""
+        event.widget.config(bg=self.app.theme["topbar_bg"])
     
     def create_topbar(self):
         """Create the top bar with add/settings/about/theme/pin buttons, using only icons."""
-        logger.info("TopbarManager: Creating topbar")
+        tbg = self.app.theme["topbar_bg"]
         
         # Clear existing topbar if it exists
         if hasattr(self.app, 'topbar') and self.app.topbar.winfo_exists():
-            logger.info("TopbarManager: Destroying existing topbar")
             self.app.topbar.destroy()
         
         # Create new topbar frame
-        self.app.topbar = tk.Frame(self.app, bg=self.app.theme["topbar_bg"], height=18)
-        logger.info(f"TopbarManager: Created topbar frame with bg={self.app.theme['topbar_bg']}")
+        self.app.topbar = tk.Frame(self.app, bg=tbg, height=18)
         
         # Pack the topbar at the top
         self.app.topbar.pack(side=tk.TOP, fill=tk.X)
-        logger.info("TopbarManager: Packed topbar at top")
         
-        # Force update to ensure the frame is created and packed
-        self.app.update_idletasks()
+        common = self._button_kwargs()
         
         # Add button (icon only)
-        self.app.add_btn = tk.Button(self.app.topbar, text="✚", bg=self.app.theme["topbar_bg"], 
-                                    fg=self.app.theme["button_fg"], font=("Segoe UI", 9), relief=tk.FLAT, 
-                                    command=self.app.add_button, bd=0, highlightthickness=0, 
-                                    activebackground=self.app.theme["button_hover"], 
-                                    activeforeground=self.app.theme["button_fg"])
+        self.app.add_btn = tk.Button(self.app.topbar, text="✚", command=self.app.add_button, **common)
         self.app.add_btn.pack(side=tk.LEFT, padx=(2,0), pady=1, ipadx=1, ipady=0)
-        self.app.add_btn.bind("<Enter>", lambda e: self.app.add_btn.config(bg=self.app.theme["button_hover"]))
-        self.app.add_btn.bind("<Leave>", lambda e: self.app.add_btn.config(bg=self.app.theme["topbar_bg"]))
-        self.app.add_btn_tooltip = Tooltip(self.app.add_btn, self.app._("Add new button"))
-        
-        # File-explorer add button (icon only)
-        self.app.file_add_btn = tk.Button(self.app.topbar, text="📂", bg=self.app.theme["topbar_bg"], 
-                                         fg=self.app.theme["button_fg"], font=("Segoe UI", 9), relief=tk.FLAT, 
-                                         command=self.app.add_buttons_from_files, bd=0, highlightthickness=0, 
-                                         activebackground=self.app.theme["button_hover"], 
-                                         activeforeground=self.app.theme["button_fg"])
-        self.app.file_add_btn.pack(side=tk.LEFT, padx=(2,0), pady=1, ipadx=1, ipady=0)
-        self.app.file_add_btn.bind("<Enter>", lambda e: self.app.file_add_btn.config(bg=self.app.theme["button_hover"]))
-        self.app.file_add_btn.bind("<Leave>", lambda e: self.app.file_add_btn.config(bg=self.app.theme["topbar_bg"]))
-        self.app.file_add_btn_tooltip = Tooltip(self.app.file_add_btn, self.app._("Add from file(s)"))
+        self.app.add_btn.bind("<Enter>", self._on_btn_enter)
+        self.app.add_btn.bind("<Leave>", self._on_btn_leave)
+        self.app.add_btn_tooltip = Tooltip(self.app.add_btn, self._t("Add new button"))
         
         # Theme toggle button (icon only)
-        self.app.theme_btn = tk.Button(self.app.topbar, text="☀️" if self.app.theme_name=="light" else "🌙", 
-                                      bg=self.app.theme["topbar_bg"], fg=self.app.theme["button_fg"], 
-                                      font=("Segoe UI", 9), relief=tk.FLAT, command=self.app.toggle_theme, 
-                                      bd=0, highlightthickness=0, activebackground=self.app.theme["button_hover"], 
-                                      activeforeground=self.app.theme["button_fg"])
+        self.app.theme_btn = tk.Button(self.app.topbar, text="☀️" if self.app.theme_name=="light" else "🌙",
+                                       command=self.app.toggle_theme, **common)
         self.app.theme_btn.pack(side=tk.RIGHT, padx=(0,2), pady=1)
-        self.app.theme_btn_tooltip = Tooltip(self.app.theme_btn, self.app._("Toggle theme"))
+        self.app.theme_btn_tooltip = Tooltip(self.app.theme_btn, self._t("Toggle theme"))
         
         # Pin (always on top) button
         self.app.always_on_top = self.app.config_data.get("always_on_top", True)
-        self.app.pin_btn = tk.Button(self.app.topbar, text="📌" if self.app.always_on_top else "📍", 
-                                    bg=self.app.theme["topbar_bg"], fg=self.app.theme["button_fg"], 
-                                    font=("Segoe UI", 9), relief=tk.FLAT, command=self.app.toggle_on_top, 
-                                    bd=0, highlightthickness=0, activebackground=self.app.theme["button_hover"], 
-                                    activeforeground=self.app.theme["button_fg"])
+        self.app.pin_btn = tk.Button(self.app.topbar, text="📌" if self.app.always_on_top else "📍",
+                                     command=self.app.toggle_on_top, **common)
         self.app.pin_btn.pack(side=tk.RIGHT, padx=(0,2), pady=1)
-        self.app.pin_btn_tooltip = Tooltip(self.app.pin_btn, self.app._("Keep on top") if self.app.always_on_top else self.app._("Do not keep on top"))
+        self.app.pin_btn_tooltip = Tooltip(self.app.pin_btn, self._t("Keep on top") if self.app.always_on_top else self._t("Do not keep on top"))
+        
+        # Build the remaining buttons the first time the pointer reaches the
+        # topbar, or shortly after startup, whichever happens first
+        self._rest_built = False
+        self._rest_bind_id = self.app.topbar.bind("<Enter>", lambda e: self._materialize_rest(), add="+")
+        self.app.after(500, self._materialize_rest)
+        
+        logger.debug("TopbarManager: topbar built bg=%s", tbg)
+    
+    def _materialize_rest(self):
+        """Create the file add, settings and about buttons (once per topbar)."""
+        if self._rest_built:
+            return
+        self._rest_built = True
+        if self._rest_bind_id is not None:
+            if self.app.topbar.winfo_exists():
+                self.app.topbar.unbind("<Enter>", self._rest_bind_id)
+            self._rest_bind_id = None
+        # Minimal mode replaces the topbar contents with its own buttons
+        if self.app.config_data.get("minimal_mode", False) or not self.app.topbar.winfo_exists():
+            return
+        
+        common = self._button_kwargs()
+        
+        # File-explorer add button (icon only)
+        self.app.file_add_btn = tk.Button(self.app.topbar, text="📂", command=self.app.add_buttons_from_files, **common)
+        self.app.file_add_btn.pack(side=tk.LEFT, padx=(2,0), pady=1, ipadx=1, ipady=0)
+        self.app.file_add_btn.bind("<Enter>", self._on_btn_enter)
+        self.app.file_add_btn.bind("<Leave>", self._on_btn_leave)
+        self.app.file_add_btn_tooltip = Tooltip(self.app.file_add_btn, self._t("Add from file(s)"))
         
         # Settings button (icon only)
-        self.app.settings_btn = tk.Button(self.app.topbar, text="⚙️", bg=self.app.theme["topbar_bg"], 
-                                         fg=self.app.theme["button_fg"], font=("Segoe UI", 9), relief=tk.FLAT, 
-                                         command=self.app.open_settings, bd=0, highlightthickness=0, 
-                                         activebackground=self.app.theme["button_hover"], 
-                                         activeforeground=self.app.theme["button_fg"])
+        self.app.settings_btn = tk.Button(self.app.topbar, text="⚙️", command=self.app.open_settings, **common)
         self.app.settings_btn.pack(side=tk.RIGHT, padx=(0,2), pady=1)
-        self.app.settings_btn_tooltip = Tooltip(self.app.settings_btn, self.app._("Settings"))
+        self.app.settings_btn_tooltip = Tooltip(self.app.settings_btn, self._t("Settings"))
         
         # About button (icon only)
-        self.app.about_btn = tk.Button(self.app.topbar, text="❔", bg=self.app.theme["topbar_bg"], 
-                                      fg=self.app.theme["button_fg"], font=("Segoe UI", 9), relief=tk.FLAT, 
-                                      command=self.app.open_about, bd=0, highlightthickness=0, 
-                                      activebackground=self.app.theme["button_hover"], 
-                                      activeforeground=self.app.theme["button_fg"])
+        self.app.about_btn = tk.Button(self.app.topbar, text="❔", command=self.app.open_about, **common)
         self.app.about_btn.pack(side=tk.RIGHT, padx=(0,2), pady=1)
-        self.app.about_btn_tooltip = Tooltip(self.app.about_btn, self.app._("About"))
-        
-        self.app.attributes("-topmost", self.app.always_on_top)
-        logger.info("TopbarManager: Topbar creation completed with all buttons")
+        self.app.about_btn_tooltip = Tooltip(self.app.about_btn, self._t("About"))
+    
+    def retheme(self):
+        """Restyle the existing topbar widgets (normal or minimal mode) for the current theme."""
+        theme = self.app.theme
+        topbar_bg = theme["topbar_bg"]
+        button_style = {"bg": topbar_bg, "fg": theme["button_fg"],
+                        "activebackground": theme["button_hover"], "activeforeground": theme["button_fg"]}
+        label_style = {"bg": topbar_bg, "fg": theme["label_fg"]}
+        self.app.topbar.config(bg=topbar_bg)
+        for widget in self.app.topbar.winfo_children():
+            if isinstance(widget, tk.Button):
+                # Close button hover handlers read the live theme, no rebinding needed
+                widget.config(**(label_style if widget.cget("text") == "✕" else button_style))
+            elif isinstance(widget, tk.Label):
+                widget.config(**label_style)
+            elif isinstance(widget, tk.Frame):
+                widget.config(bg=topbar_bg)
     
     def update_topbar_tooltips(self):
         """Update topbar tooltips after language change."""
         if hasattr(self.app, "add_btn_tooltip"):
-            self.app.add_btn_tooltip.text = self.app._("Add new button")
+            self.app.add_btn_tooltip.text = self._t("Add new button")
         if hasattr(self.app, "file_add_btn_tooltip"):
-            self.app.file_add_btn_tooltip.text = self.app._("Add from file(s)")
+            self.app.file_add_btn_tooltip.text = self._t("Add from file(s)")
         if hasattr(self.app, "theme_btn_tooltip"):
-            self.app.theme_btn_tooltip.text = self.app._("Toggle theme")
+            self.app.theme_btn_tooltip.text = self._t("Toggle theme")
         if hasattr(self.app, "pin_btn_tooltip"):
-            self.app.pin_btn_tooltip.text = self.app._("Keep on top") if self.app.always_on_top else self.app._("Do not keep on top")
+            self.app.pin_btn_tooltip.text = self._t("Keep on top") if self.app.always_on_top else self._t("Do not keep on top")
         if hasattr(self.app, "settings_btn_tooltip"):
-            self.app.settings_btn_tooltip.text = self.app._("Settings")
+            self.app.settings_btn_tooltip.text = self._t("Settings")
         if hasattr(self.app, "about_btn_tooltip"):
-            self.app.about_btn_tooltip.text = self.app._("About")
+            self.app.about_btn_tooltip.text = self._t("About")
     
     def toggle_on_top(self):
         """Toggle the always-on-top state and update the pin button."""
@@ -116,7 +153,7 @@ class TopbarManager:
         if hasattr(self.app, 'pin_btn') and self.app.pin_btn.winfo_exists():
             self.app.pin_btn.config(text="📌" if self.app.always_on_top else "📍")
         if hasattr(self.app, 'pin_btn_tooltip'):
-            self.app.pin_btn_tooltip.text = self.app._("Keep on top") if self.app.always_on_top else self.app._("Do not keep on top")
+            self.app.pin_btn_tooltip.text = self._t("Keep on top") if self.app.always_on_top else self._t("Do not keep on top")
     
     def toggle_theme(self):
         """Toggle between light and dark themes."""
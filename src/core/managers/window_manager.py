@@ -1,9 +1,47 @@
 """Window management functionality for QuickButtons."""
 
+import functools
+import re
 import tkinter as tk
 import sys
 from src.utils.logger import logger
 
+# PIL is only needed for the iconphoto fallback
+try:
+    from src.ui._icon_cache import get_photo
+    _HAVE_PIL = True
+except ImportError:
+    _HAVE_PIL = False
+
+# "widthxheight+x+y", Tk reports off-screen positions as "+-10+20"
+_GEOM_RE = re.compile(r'^(\d+)x(\d+)\+(-?\d+)\+(-?\d+)$')
+
+
+@functools.lru_cache(maxsize=16)
+def _check_geometry(geometry_string, screen_width, screen_height):
+    """Check a geometry string against the given screen size (memoized)."""
+    m = _GEOM_RE.match(geometry_string)
+    if not m:
+        logger.debug(f"Unparseable geometry string '{geometry_string}'")
+        return False
+    width, height, x, y = map(int, m.groups())
+    
+    # Check if window would be completely off-screen
+    if x >= screen_width or y >= screen_height:
+        return False
+    
+    # Check if window would be partially off-screen (with some tolerance)
+    # Allow window to be partially off-screen by a small amount (50 pixels)
+    tolerance = 50
+    if x + width < -tolerance or y + height < -tolerance:
+        return False
+    
+    # Check if window is too large for screen (with some tolerance)
+    if width > screen_width + tolerance or height > screen_height + tolerance:
+        return False
+    
+    return True
+
 
 class WindowManager:
     """Handles window geometry, positioning, and management."""
@@ -11,6 +49,10 @@ class WindowManager:
     def __init__(self, app):
         self.app = app
         self._resize_after_id = None
+        # Icon method that worked ("bitmap" or "photo"), None until one succeeds
+        self._icon_method = None
+        # Geometry last written to the config, used to skip no-op saves
+        self._last_saved_geom = None
     
     def setup_window(self, config_data, theme):
         """Set up the main window with proper geometry and attributes."""
@@ -50,10 +92,11 @@ class WindowManager:
             self.app.geometry("220x110")
             # Center the window on screen
             self._center_window()
+        self._last_saved_geom = config_data.get("window_geometry")
         
         self.app.minsize(120, 60)
         self.app.resizable(True, True)
-        self.app.attributes("-topmost", True)
+        self.app.attributes("-topmost", config_data.get("always_on_top", True))
         self.app.protocol("WM_DELETE_WINDOW", self.app.on_close)
         
         # Window management
@@ -64,28 +107,34 @@ class WindowManager:
         """Set the window and taskbar icon."""
         try:
             from src.core.constants import ICON_ICO_PATH
-            logger.info(f"Setting window icon from: {ICON_ICO_PATH}")
+            logger.debug("Setting window icon from: %s", ICON_ICO_PATH)
             
             # Try both iconbitmap and iconphoto methods
             try:
                 self.app.iconbitmap(ICON_ICO_PATH)
-                logger.info("Window icon set with iconbitmap successfully")
+                self._icon_method = "bitmap"
+                logger.debug("Window icon set with iconbitmap")
             except Exception as e:
                 logger.warning(f"iconbitmap failed: {e}")
-                # Fallback to iconphoto method
-                try:
-                    from PIL import Image, ImageTk
-                    icon_img = Image.open(ICON_ICO_PATH)
-                    icon_photo = ImageTk.PhotoImage(icon_img)
-                    self.app.iconphoto(True, icon_photo)
-                    logger.info("Window icon set with iconphoto successfully")
-                except Exception as e2:
-                    logger.warning(f"iconphoto also failed: {e2}")
+                # Fallback to iconphoto method, once the main loop is running
+                self.app.after_idle(self._set_icon_photo, ICON_ICO_PATH)
             
 
         except Exception as e:
             logger.warning(f"Could not set window icon: {e}")
     
+    def _set_icon_photo(self, icon_path):
+        """Set the window icon with iconphoto (requires PIL)."""
+        if not _HAVE_PIL:
+            logger.warning("iconphoto fallback unavailable: PIL is not installed")
+            return
+        try:
+            self.app.iconphoto(True, get_photo(icon_path))
+            self._icon_method = "photo"
+            logger.debug("Window icon set with iconphoto")
+        except Exception as e:
+            logger.warning(f"iconphoto also failed: {e}")
+    
     def _on_window_configure(self, event):
         """Debounce window resize/move events to avoid excessive config writes."""
         if self._resize_after_id:
@@ -94,10 +143,14 @@ class WindowManager:
     
     def _save_window_geometry(self):
         """Save the current window geometry to config."""
+        self._resize_after_id = None
         geom = self.app.geometry()
+        # <Configure> also fires on redraws and map events with an unchanged geometry
+        if geom == self._last_saved_geom:
+            return
+        self._last_saved_geom = geom
         self.app.config_data["window_geometry"] = geom
         self.app.save_config()
-        self._resize_after_id = None
     
     def _on_window_map(self, event=None):
         """Handle window becoming visible - validate position and reset if needed."""
@@ -117,42 +170,9 @@ class WindowManager:
         Returns:
             bool: True if geometry is valid, False otherwise
         """
-        try:
-            # Parse geometry string
-            if 'x' not in geometry_string or '+' not in geometry_string:
-                return False
-            
-            # Split into size and position parts
-            size_part, pos_part = geometry_string.split('+', 1)
-            if 'x' not in size_part:
-                return False
-            
-            width, height = map(int, size_part.split('x'))
-            x, y = map(int, pos_part.split('+'))
-            
-            # Get screen dimensions
-            screen_width = self.app.winfo_screenwidth()
-            screen_height = self.app.winfo_screenheight()
-            
-            # Check if window would be completely off-screen
-            if x >= screen_width or y >= screen_height:
-                return False
-            
-            # Check if window would be partially off-screen (with some tolerance)
-            # Allow window to be partially off-screen by a small amount (50 pixels)
-            tolerance = 50
-            if x + width < -tolerance or y + height < -tolerance:
-                return False
-            
-            # Check if window is too large for screen (with some tolerance)
-            if width > screen_width + tolerance or height > screen_height + tolerance:
-                return False
-            
-            return True
-            
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Invalid geometry string '{geometry_string}': {e}")
+        if not isinstance(geometry_string, str):
             return False
+        return _check_geometry(geometry_string, self.app.winfo_screenwidth(), self.app.winfo_screenheight())
     
     def _center_window(self):
         """Center the window on the primary screen."""
@@ -187,24 +207,21 @@ class WindowManager:
     def set_icon_delayed(self):
         """Set the icon after the window is fully created (Windows workaround)."""
         try:
-            logger.info("Setting icon with delayed method")
             from src.core.constants import ICON_ICO_PATH
             
+            # Reuse the method that already worked (the photo comes from the icon cache)
+            if self._icon_method == "photo":
+                self._set_icon_photo(ICON_ICO_PATH)
+                return
+            
             # Try both methods in delayed setting too
             try:
                 self.app.iconbitmap(ICON_ICO_PATH)
-                logger.info("Delayed iconbitmap successful")
+                logger.debug("Delayed iconbitmap set")
             except Exception as e:
                 logger.warning(f"Delayed iconbitmap failed: {e}")
                 # Fallback to iconphoto method
-                try:
-                    from PIL import Image, ImageTk
-                    icon_img = Image.open(ICON_ICO_PATH)
-                    icon_photo = ImageTk.PhotoImage(icon_img)
-                    self.app.iconphoto(True, icon_photo)
-                    logger.info("Delayed iconphoto successful")
-                except Exception as e2:
-                    logger.warning(f"Delayed iconphoto also failed: {e2}")
+                self._set_icon_photo(ICON_ICO_PATH)
             
 
         except Exception as e:
@@ -1,6 +1,28 @@
-"""User interface components."""
+"""User interface components.
+
+apply_theme_recursive is imported on first attribute access (PEP 562), so
+loading the package does not pull in the themes module.
+"""
+
+import importlib
 
 from .components.tooltip import Tooltip
-from .themes import apply_theme_recursive
 
-__all__ = ['Tooltip', 'apply_theme_recursive'] 
\ No newline at end of file
+_LAZY_MODULES = {
+    'apply_theme_recursive': '.themes',
+}
+
+__all__ = ['Tooltip', 'apply_theme_recursive']
+
+
+def __getattr__(name):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Shared cache of decoded icon images."""
+
+import functools
+from PIL import Image, ImageTk
+
+
+@functools.lru_cache(maxsize=8)
+def get_photo(path, size=None):
+    """
+    Load an image file as a PhotoImage, decoding each (path, size) pair only once.
+
+    The cache keeps the PhotoImage alive, so callers may hand it to widgets
+    without holding their own reference.
+
+    Args:
+        path (str): Path to the image file
+        size (tuple): Optional (width, height) to resize to
+
+    Returns:
+        ImageTk.PhotoImage: The decoded image
+    """
+    img = Image.open(path)
+    if size:
+        img = img.resize(size, Image.LANCZOS)
+    return ImageTk.PhotoImage(img)
@@ -1,30 +1,111 @@
 """Tooltip component for Tkinter widgets."""
 
 import tkinter as tk
+import weakref
+
+
+class _SharedTipWindow:
+    """Single tooltip window shared by every Tooltip, owned by the one currently shown."""
+    
+    _window = None
+    _label = None
+    _owner = None
+    
+    @classmethod
+    def show(cls, owner, widget, text, x, y, bg, fg):
+        """Show text at (x, y) on behalf of owner, taking over from any other tooltip."""
+        if cls._window is None or not cls._window.winfo_exists():
+            # Parent to the root so the window outlives individual (grid) widgets
+            cls._window = tw = tk.Toplevel(widget.nametowidget("."))
+            tw.wm_overrideredirect(True)
+            tw.attributes("-topmost", True)  # Ensure tooltip appears above pinned application
+            cls._label = tk.Label(tw, justify=tk.LEFT, relief=tk.SOLID, borderwidth=1,
+                                  font=("tahoma", "9", "normal"))
+            cls._label.pack(ipadx=4, ipady=2)
+        cls._owner = owner
+        cls._label.config(text=text, background=bg, foreground=fg)
+        cls._window.wm_geometry(f"+{x}+{y}")
+        cls._window.deiconify()
+        cls._window.lift()
+    
+    @classmethod
+    def hide(cls, owner):
+        """Hide the window if owner is the tooltip currently shown."""
+        if cls._owner is owner:
+            cls._owner = None
+            if cls._window.winfo_exists():
+                cls._window.withdraw()
+    
+    @classmethod
+    def set_text(cls, owner, text):
+        """Update the visible text if owner is the tooltip currently shown."""
+        if cls._owner is owner and cls._window.winfo_exists():
+            cls._label.config(text=text)
+
 
 class Tooltip:
     """Tooltip class for Tkinter widgets."""
     
+    # Live tooltips, so a theme change can refresh their colors
+    _instances = weakref.WeakSet()
+    
     def __init__(self, widget, text, delay=500):
         self.widget = widget
         self._text = text  # Set the _text attribute properly
         self.delay = delay  # milliseconds
         self._id = None
-        self._tipwindow = None
         self._x = self._y = 0
+        self._outside = True  # Pointer is not over the widget
+        self._resolve_colors()
+        Tooltip._instances.add(self)
         widget.bind('<Enter>', self._enter, add='+')
         widget.bind('<Leave>', self._leave, add='+')
         widget.bind('<ButtonPress>', self._leave, add='+')
+        # The shared window outlives the widget, so hide it when the widget goes away
+        widget.bind('<Destroy>', self._leave, add='+')
+
+    def _resolve_colors(self):
+        """Look up the tooltip colors from the theme of the widget's master."""
+        # Try to get theme colors from the widget's master
+        try:
+            if hasattr(self.widget, 'master') and hasattr(self.widget.master, 'theme'):
+                theme = self.widget.master.theme
+                self._bg = theme.get("tooltip_bg", "#ffffe0")
+                self._fg = theme.get("tooltip_fg", "#000000")
+            else:
+                self._bg = "#ffffe0"
+                self._fg = "#000000"
+        except:
+            self._bg = "#ffffe0"
+            self._fg = "#000000"
+
+    def set_colors(self, bg, fg):
+        """Set the tooltip colors."""
+        self._bg = bg
+        self._fg = fg
+
+    @classmethod
+    def refresh_colors(cls):
+        """Re-read theme colors for all live tooltips (call after a theme change)."""
+        for tooltip in list(cls._instances):
+            tooltip._resolve_colors()
 
     def _enter(self, event=None):
+        # Ignore enters that bubble up from other widgets
+        if event is not None and event.widget is not self.widget:
+            return
+        self._outside = False
         self._schedule()
 
     def _leave(self, event=None):
+        self._outside = True
         self._unschedule()
         self._hide_tip()
 
     def _schedule(self):
         self._unschedule()
+        if _SharedTipWindow._owner is self:
+            return
         self._id = self.widget.after(self.delay, self._show_tip)
 
     def _unschedule(self):
@@ -33,41 +114,19 @@ class Tooltip:
             self._id = None
 
     def _show_tip(self, event=None):
-        if self._tipwindow or not self.text:
+        self._id = None
+        # A late callback after the pointer already left must not show the tip
+        if self._outside or _SharedTipWindow._owner is self or not self.text:
             return
         
         x, y, cx, cy = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
         x = x + self.widget.winfo_rootx() + 20
         y = y + cy + self.widget.winfo_rooty() + 20
-        self._tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        tw.attributes("-topmost", True)  # Ensure tooltip appears above pinned application
-        
-        # Try to get theme colors from the widget's master
-        try:
-            if hasattr(self.widget, 'master') and hasattr(self.widget.master, 'theme'):
-                theme = self.widget.master.theme
-                bg_color = theme.get("tooltip_bg", "#ffffe0")
-                fg_color = theme.get("tooltip_fg", "#000000")
-            else:
-                bg_color = "#ffffe0"
-                fg_color = "#000000"
-        except:
-            bg_color = "#ffffe0"
-            fg_color = "#000000"
         
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                         background=bg_color, foreground=fg_color,
-                         relief=tk.SOLID, borderwidth=1,
-                         font=("tahoma", "9", "normal"))
-        label.pack(ipadx=4, ipady=2)
+        _SharedTipWindow.show(self, self.widget, self.text, x, y, self._bg, self._fg)
 
     def _hide_tip(self):
-        tw = self._tipwindow
-        self._tipwindow = None
-        if tw:
-            tw.destroy()
+        _SharedTipWindow.hide(self)
 
     @property
     def text(self):
@@ -77,7 +136,4 @@ class Tooltip:
     def text(self, value):
         self._text = value
         # If tooltip is visible, update it
-        if hasattr(self, '_tipwindow') and self._tipwindow:
-            for child in self._tipwindow.winfo_children():
-                if isinstance(child, tk.Label):
-                    child.config(text=value) 
\ No newline at end of file
+        _SharedTipWindow.set_text(self, value) 
\ No newline at end of file
@@ -1,9 +1,30 @@
-"""Dialog modules for QuickButtons UI."""
+"""Dialog modules for QuickButtons UI.
 
-from .about import AboutDialog
-from .settings import SettingsDialog
-from .button_settings import ButtonSettingsDialog
-from .output_overlay import OutputOverlay
-from .llm_overlay import LLMChatOverlay
+Dialogs are imported on first attribute access (PEP 562) so that loading the
+package does not pull in every dialog module at startup.
+"""
 
-__all__ = ['AboutDialog', 'SettingsDialog', 'ButtonSettingsDialog', 'OutputOverlay', 'LLMChatOverlay'] 
\ No newline at end of file
+import importlib
+
+_DIALOG_MODULES = {
+    'AboutDialog': '.about',
+    'SettingsDialog': '.settings',
+    'ButtonSettingsDialog': '.button_settings',
+    'OutputOverlay': '.output_overlay',
+    'LLMChatOverlay': '.llm_overlay',
+}
+
+__all__ = ['AboutDialog', 'SettingsDialog', 'ButtonSettingsDialog', 'OutputOverlay', 'LLMChatOverlay']
+
+
+def __getattr__(name):
+    module_name = _DIALOG_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
@@ -2,20 +2,40 @@
 
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
 
 from src.core.constants import ICON_PATH, APP_VERSION
+from src.ui._icon_cache import get_photo
 from src.ui.themes import apply_theme_recursive
 from src.utils.logger import logger
 
+_WEBSITE_URL = "https://Rik.blue"
+
+
+def _open_website(event):
+    """Open the project website in the default browser."""
+    import webbrowser
+    webbrowser.open(_WEBSITE_URL)
+
+
+def _on_link_enter(event):
+    """Darken the link under the pointer."""
+    event.widget.config(fg="#0033aa")
+
+
+def _on_link_leave(event):
+    """Restore the link color."""
+    event.widget.config(fg="#0066cc")
+
+
 class AboutDialog(tk.Toplevel):
     """Dialog showing information about QuickButtons."""
     
     def __init__(self, master, theme):
         super().__init__(master)
+        dialog_bg, label_fg = theme["dialog_bg"], theme["label_fg"]
         self.title(master._("About QuickButtons"))
         self.geometry("340x240+340+340")
-        self.configure(bg=theme["dialog_bg"])
+        self.configure(bg=dialog_bg)
         self.resizable(False, False)
         
         # Set window icon
@@ -27,10 +47,8 @@ class AboutDialog(tk.Toplevel):
         
         # App icon (if available)
         try:
-            icon_img = Image.open(ICON_PATH)
-            icon_img = icon_img.resize((48, 48), Image.LANCZOS)
-            icon_img = ImageTk.PhotoImage(icon_img)
-            icon_label = tk.Label(self, image=icon_img, bg=theme["dialog_bg"])
+            icon_img = get_photo(ICON_PATH, (48, 48))
+            icon_label = tk.Label(self, image=icon_img, bg=dialog_bg)
             icon_label.image = icon_img
             icon_label.pack(pady=(18, 6))
         except Exception as e:
@@ -39,35 +57,31 @@ class AboutDialog(tk.Toplevel):
         
         # App name and version
         name_label = tk.Label(self, text=master._("QuickButtons"), font=("Segoe UI", 16, "bold"), 
-                             bg=theme["dialog_bg"], fg=theme["button_fg"])
+                             bg=dialog_bg, fg=theme["button_fg"])
         name_label.pack(pady=(0, 2))
         
         version_label = tk.Label(self, text=master._("Version: {version}").format(version=APP_VERSION), 
-                                font=("Segoe UI", 10), bg=theme["dialog_bg"], fg=theme["label_fg"])
+                                font=("Segoe UI", 10), bg=dialog_bg, fg=label_fg)
         version_label.pack()
         
         # Author
         author_label = tk.Label(self, text=master._("Made by Rik Heijmann"), font=("Segoe UI", 10), 
-                               bg=theme["dialog_bg"], fg=theme["label_fg"])
+                               bg=dialog_bg, fg=label_fg)
         author_label.pack(pady=(2, 2))
         
         # Website link
-        website_label = tk.Label(self, text="https://Rik.blue", font=("Segoe UI", 9), 
-                                bg=theme["dialog_bg"], fg="#0066cc", cursor="hand2")
+        website_label = tk.Label(self, text=_WEBSITE_URL, font=("Segoe UI", 9), 
+                                bg=dialog_bg, fg="#0066cc", cursor="hand2")
         website_label.pack(pady=(0, 8))
         
         # Make website clickable
-        def open_website(event):
-            import webbrowser
-            webbrowser.open("https://Rik.blue")
-        
-        website_label.bind("<Button-1>", open_website)
-        website_label.bind("<Enter>", lambda e: website_label.config(fg="#0033aa"))
-        website_label.bind("<Leave>", lambda e: website_label.config(fg="#0066cc"))
+        website_label.bind("<Button-1>", _open_website)
+        website_label.bind("<Enter>", _on_link_enter)
+        website_label.bind("<Leave>", _on_link_leave)
         
         # Description
         desc_label = tk.Label(self, text=master._("A modern floating button panel for scripts."), 
-                             font=("Segoe UI", 10), bg=theme["dialog_bg"], fg=theme["label_fg"], 
+                             font=("Segoe UI", 10), bg=dialog_bg, fg=label_fg, 
                              wraplength=300, justify="center")
         desc_label.pack(pady=(0, 10))
         
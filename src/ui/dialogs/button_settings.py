@@ -1,23 +1,136 @@
 """Button settings dialog for QuickButtons application."""
 
+import functools
 import tkinter as tk
 from tkinter import filedialog, messagebox, colorchooser
 import re
 
+from src.core.constants import ICON_ICO_PATH
 from src.ui.components.tooltip import Tooltip
 from src.ui.themes import apply_theme_recursive
+from src.utils.animations import animate_button_press
 from src.utils.logger import logger
+from src.utils.translations import translation_manager
+
+
+# Relevant emojis for this app, offered by the emoji picker
+_PICKER_EMOJIS = (
+    "🖥️", "🌐", "🎵", "📤", "⚡", "🔗", "📝", "🔊", "⭐", "❓", "✅", "❌", "🕒", "📅", "🔒", "🔓"
+)
+
+# LLM providers offered in the provider menu
+_LLM_PROVIDERS = ("openai", "azure", "gemini", "litellm")
+
+# Supported models for the providers that offer a model dropdown
+_LLM_MODELS = {
+    "openai": ("gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-3.5-turbo", "gpt-3.5-turbo-16k"),
+    "gemini": ("gemini-pro", "gemini-pro-vision", "gemini-1.5-pro", "gemini-1.5-flash"),
+    "litellm": ("gpt-3.5-turbo", "gpt-4", "claude-3-opus", "mixtral-8x7b"),
+}
+
+# Button type codes with their (untranslated) display names, in menu order
+_TYPE_CODES = (
+    # Core execution types
+    ("python_script", "Python Script"),
+    ("app_launcher", "Application Launcher"),
+    ("shell", "Run Shell Command"),
+    
+    # Web & communication
+    ("website", "Open Website"),
+    ("post", "POST Request"),
+    ("llm", "LLM Chat"),
+    
+    # Media & entertainment
+    ("music", "Play Music"),
+    
+    # Monitoring & testing
+    ("timer", "Timer"),
+    ("pomodoro", "Pomodoro Timer"),
+    ("ping", "Ping"),
+    ("network_speed", "Network Speed Test"),
+    ("http_test", "HTTP Test"),
+    ("color_picker", "Color Picker"),
+)
+
+
+# Name of the ButtonSettingsDialog method that builds the fields of each button type
+_TYPE_BUILDERS = {
+    "python_script": "_build_python_script_fields",
+    "website": "_build_website_fields",
+    "music": "_build_music_fields",
+    "post": "_build_post_fields",
+    "shell": "_build_shell_fields",
+    "timer": "_build_timer_fields",
+    "llm": "_build_llm_fields",
+    "app_launcher": "_build_app_launcher_fields",
+    "network_speed": "_build_network_speed_fields",
+    "ping": "_build_ping_fields",
+    "pomodoro": "_build_pomodoro_fields",
+    "http_test": "_build_http_test_fields",
+    "color_picker": "_build_color_picker_fields",
+}
+
+# Base button config keys with the dialog variable holding each, text fields first
+_BASE_STR_FIELDS = (
+    ("label", "label_var"),
+    ("tooltip", "tooltip_var"),
+    ("shortcut", "shortcut_var"),
+    ("args", "args_var"),
+    ("script", "script_var"),
+    ("url", "url_var"),
+    ("music", "music_var"),
+    ("icon", "icon_var"),
+)
+_BASE_BOOL_FIELDS = (
+    ("use_default_colors", "use_default_colors_var"),
+    ("use_default_animation", "use_default_animation_var"),
+    ("disable_animation", "disable_animation_var"),
+)
+
+# Most common button types, prebuilt in idle time so switching to them is instant
+_WARM_TYPES = ("python_script", "website", "shell")
+
+
+@functools.lru_cache(maxsize=None)
+def _type_labels(language):
+    """Return the (code -> display, display -> code) type maps for ``language``."""
+    code_to_disp = {code: translation_manager.get_text(text, language) for code, text in _TYPE_CODES}
+    return code_to_disp, {v: k for k, v in code_to_disp.items()}
+
+
+# Button press animations with their (untranslated) display names, in menu order
+_ANIMATION_CODES = (
+    ("ripple", "Ripple Effect"),
+    ("scale", "Scale Down"),
+    ("glow", "Glow Effect"),
+    ("bounce", "Bounce"),
+    ("shake", "Shake"),
+    ("flame", "Flame Burst"),
+    ("confetti", "Confetti Burst"),
+    ("sparkle", "Sparkle Effect"),
+    ("explosion", "Explosion"),
+    ("combined", "Combined (Scale + Glow)"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _animation_labels(language):
+    """Return the (code -> display, display -> code) animation maps for ``language``."""
+    code_to_disp = {code: translation_manager.get_text(text, language) for code, text in _ANIMATION_CODES}
+    return code_to_disp, {v: k for k, v in code_to_disp.items()}
 
 
 class ButtonSettingsDialog(tk.Toplevel):
     """Dialog for adding/editing a button. Now scrollable and resizable."""
     
     def __init__(self, master, theme, btn_cfg=None, on_save=None, allow_delete=False):
-        super().__init__(master)
+        # A dedicated window class lets the option defaults below apply to
+        # this dialog's widgets only
+        super().__init__(master, class_="ButtonSettings")
         if btn_cfg is None:
-            self.title(self.master._("Add New Button"))
+            self.title(self._t("Add New Button"))
         else:
-            self.title(self.master._("Edit Button"))
+            self.title(self._t("Edit Button"))
         self.theme = theme
         self.on_save = on_save
         self.btn_cfg = btn_cfg.copy() if btn_cfg else {}
@@ -25,16 +138,29 @@ class ButtonSettingsDialog(tk.Toplevel):
         self.configure(bg=theme["dialog_bg"])
         self.resizable(True, True)  # Allow resizing
         
-        # Set window icon
-        try:
-            from src.core.constants import ICON_ICO_PATH
-            self.iconbitmap(ICON_ICO_PATH)
-        except Exception as e:
-            logger.warning(f"Could not set button settings dialog icon: {e}")
+        # Default colours for frames and labels, resolved by Tk at widget
+        # creation instead of being passed to every constructor
+        for pattern, value in (
+            ("*ButtonSettings*Frame.background", theme["dialog_bg"]),
+            ("*ButtonSettings*Labelframe.background", theme["dialog_bg"]),
+            ("*ButtonSettings*Labelframe.foreground", theme["label_fg"]),
+            ("*ButtonSettings*Label.background", theme["dialog_bg"]),
+            ("*ButtonSettings*Label.foreground", theme["label_fg"]),
+        ):
+            self.option_add(pattern, value)
+        
+        # Style options shared by the dialog's checkbuttons, flat buttons and pickers
+        self._check_kw = dict(bg=theme["dialog_bg"], fg=theme["label_fg"], selectcolor=theme["dialog_bg"],
+                              activebackground=theme["dialog_bg"], activeforeground=theme["label_fg"])
+        self._btn_kw = dict(bg=theme["button_bg"], fg=theme["button_fg"], relief=tk.FLAT)
+        self._menu_kw = dict(bg=theme["dialog_bg"], fg=theme["label_fg"], highlightthickness=0)
+        
+        # Set window icon once the dialog is up; parsing the .ico would
+        # otherwise delay the first paint
+        self.after_idle(self._apply_icon)
         
         # --- Variables ---
         self.type_var = tk.StringVar(value=self.btn_cfg.get("type", "python_script"))
-        self.type_var.trace_add("write", lambda *args: self.update_fields())
         self.label_var = tk.StringVar(value=self.btn_cfg.get("label", "Run Python Script"))
         self.shortcut_var = tk.StringVar(value=self.btn_cfg.get("shortcut", ""))
         self.args_var = tk.StringVar(value=self.btn_cfg.get("args", ""))
@@ -56,154 +182,19 @@ class ButtonSettingsDialog(tk.Toplevel):
         self.animation_type_var = tk.StringVar(value=self.btn_cfg.get("animation_type", "ripple"))
         self.disable_animation_var = tk.BooleanVar(value=self.btn_cfg.get("disable_animation", False))
         
-        def on_default_colors_toggle():
-            if self.use_default_colors_var.get():
-                if hasattr(self, 'bg_btn'):
-                    self.bg_btn.config(state="disabled")
-                if hasattr(self, 'fg_btn'):
-                    self.fg_btn.config(state="disabled")
-            else:
-                if hasattr(self, 'bg_btn'):
-                    self.bg_btn.config(state="normal")
-                if hasattr(self, 'fg_btn'):
-                    self.fg_btn.config(state="normal")
-        
-        self.on_default_colors_toggle = on_default_colors_toggle
-        
-        def on_animation_settings_toggle():
-            """Handle animation setting changes."""
-            # Call the toggle function after UI is built
-            self.after(100, self._update_animation_controls)
-        
-        self.on_animation_settings_toggle = on_animation_settings_toggle
-        
-        def preview_animation():
-            """Preview the selected animation on a test button."""
-            try:
-                from src.utils.animations import animate_button_press
-                
-                # Get animation type code and display name
-                animation_display = self.animation_type_var.get()
-                animation_code = self.animation_display_to_code.get(animation_display, "ripple")
-                
-                logger.debug(f"Button settings preview animation called - display: '{animation_display}', code: '{animation_code}'")
-                logger.debug(f"Available mappings: {self.animation_display_to_code}")
-                
-                # Create a preview window
-                preview_window = tk.Toplevel(self)
-                preview_window.title(animation_display)
-                preview_window.geometry("280x200")
-                preview_window.configure(bg=self.theme["bg"])
-                preview_window.transient(self)
-                preview_window.grab_set()
-                preview_window.resizable(False, False)
-                
-                # Set window icon
-                try:
-                    from src.core.constants import ICON_ICO_PATH
-                    preview_window.iconbitmap(ICON_ICO_PATH)
-                except Exception as e:
-                    logger.warning(f"Could not set preview window icon: {e}")
-                
-                # Keep window border and ensure it's on top
-                preview_window.attributes('-topmost', True)
-                
-                # Center the window
-                preview_window.update_idletasks()
-                x = (preview_window.winfo_screenwidth() // 2) - (280 // 2)
-                y = (preview_window.winfo_screenheight() // 2) - (200 // 2)
-                preview_window.geometry(f"280x200+{x}+{y}")
-                
-                # Create main container
-                main_frame = tk.Frame(preview_window, bg=self.theme["bg"])
-                main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-                
-                # Animation button with the animation name
-                test_button = tk.Button(main_frame, text=animation_display, 
-                                      bg=self.theme["button_bg"], fg=self.theme["button_fg"],
-                                      font=("Segoe UI", 10), relief=tk.FLAT, bd=0,
-                                      width=15, height=2)
-                test_button.pack(expand=True)
-                
-                # Store original background for hover effects
-                test_button.orig_bg = test_button.cget("bg")
-                
-                # Add hover effects
-                def on_enter(event):
-                    test_button.config(bg=self.theme.get("button_hover", test_button.orig_bg))
-                
-                def on_leave(event):
-                    test_button.config(bg=test_button.orig_bg)
-                
-                test_button.bind("<Enter>", on_enter)
-                test_button.bind("<Leave>", on_leave)
-                
-                # Button frame for restart and close
-                button_frame = tk.Frame(main_frame, bg=self.theme["bg"])
-                button_frame.pack(pady=(15, 0))
-                
-                def trigger_animation():
-                    """Trigger the animation."""
-                    # Use center of button for ripple effect
-                    center_x = test_button.winfo_width() // 2
-                    center_y = test_button.winfo_height() // 2
-                    animate_button_press(test_button, center_x, center_y, animation_type=animation_code)
-                
-                # Restart button
-                restart_btn = tk.Button(button_frame, text="🔄", command=trigger_animation,
-                                      bg=self.theme["button_bg"], fg=self.theme["button_fg"],
-                                      font=("Segoe UI", 10), relief=tk.FLAT, bd=0,
-                                      width=3, height=1)
-                restart_btn.pack(side=tk.LEFT, padx=(0, 8))
-                
-                # Close button
-                close_btn = tk.Button(button_frame, text="✕", command=preview_window.destroy,
-                                    bg=self.theme["button_bg"], fg=self.theme["button_fg"],
-                                    font=("Segoe UI", 10), relief=tk.FLAT, bd=0,
-                                    width=3, height=1)
-                close_btn.pack(side=tk.LEFT)
-                
-                # Trigger animation immediately
-                preview_window.after(100, trigger_animation)
-                
-            except Exception as e:
-                logger.warning(f"Animation preview failed: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        self.preview_animation = preview_animation
-        
-        def _update_animation_controls():
-            """Update animation controls state based on checkboxes."""
-            if hasattr(self, 'animation_menu') and hasattr(self, 'preview_btn'):
-                # If animation is disabled for this button, disable all controls
-                if self.disable_animation_var.get():
-                    self.animation_menu.config(state="disabled")
-                    self.preview_btn.config(state="disabled")
-                # If using default animation, disable custom controls
-                elif self.use_default_animation_var.get():
-                    self.animation_menu.config(state="disabled")
-                    self.preview_btn.config(state="disabled")
-                # If using custom animation, enable controls
-                else:
-                    self.animation_menu.config(state="normal")
-                    self.preview_btn.config(state="normal")
-        
-        self._update_animation_controls = _update_animation_controls
-        
         # --- Scrollable content setup ---
         # Create main container frame for layout
-        main_container = tk.Frame(self, bg=theme["dialog_bg"])
+        main_container = tk.Frame(self)
         main_container.pack(fill=tk.BOTH, expand=True)
         
         # Create scrollable area
-        scroll_container = tk.Frame(main_container, bg=theme["dialog_bg"])
+        scroll_container = tk.Frame(main_container)
         scroll_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         self.canvas = tk.Canvas(scroll_container, bg=theme["dialog_bg"], highlightthickness=0, borderwidth=0)
         self.scrollbar = tk.Scrollbar(scroll_container, orient=tk.VERTICAL, command=self.canvas.yview, width=16,
                                      relief=tk.FLAT, borderwidth=0, highlightthickness=0)
-        self.content_frame = tk.Frame(self.canvas, bg=theme["dialog_bg"])
+        self.content_frame = tk.Frame(self.canvas)
         self.content_window = self.canvas.create_window((0,0), window=self.content_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
         
@@ -211,40 +202,44 @@ class ButtonSettingsDialog(tk.Toplevel):
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Force scrollbar to be always visible
-        self.scrollbar.pack_propagate(False)
-        
         # Set initial scrollregion to ensure scrollbar is visible
         self.canvas.configure(scrollregion=(0, 0, 0, 1000))
         
         # Create fixed bottom frame for action buttons (outside scrollable area)
-        self.bottom_frame = tk.Frame(main_container, bg=theme["dialog_bg"])
+        self.bottom_frame = tk.Frame(main_container)
         self.bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         
         # Add separator line above bottom buttons
         separator = tk.Frame(self.bottom_frame, height=1, bg=theme.get("border_color", "#444444"))
         separator.pack(fill=tk.X, pady=(0, 8))
         
-        self.content_frame.bind("<Configure>", lambda e: self._on_frame_configure())
-        self.canvas.bind("<Configure>", lambda e: self._on_canvas_configure())
-        self.bind("<Configure>", lambda e: self._on_dialog_resize())
+        # Coalesce bursts of <Configure> (e.g. while dragging the window edge)
+        # into a single layout update once Tk is idle
+        self._cfg_pending = False
+        self._last_canvas_w = -1
+        self._last_bbox = (0, 0, 0, 1000)
+        self.content_frame.bind("<Configure>", self._schedule_configure)
+        self.canvas.bind("<Configure>", self._schedule_configure)
+        self.bind("<Configure>", self._schedule_configure)
         
         # Add mouse wheel scrolling support
         self._bind_mousewheel()
         
-        # Force scrollbar to be visible
-        self.after(100, self._ensure_scrollbar_visible)
-        
-        # Initialize header_rows list
-        self.header_rows = []
+        # Header rows keyed by id(row), in insertion order; their frame exists once the POST fields are built
+        self.header_rows = {}
+        self.headers_frame = None
         
-        self.build_ui(allow_delete)
+        # Tooltips are only created when their widget is first hovered; one
+        # <Enter> binding on the dialog (whose bindtag every child carries)
+        # picks them up
+        self._pending_tooltips = {}
+        self.bind("<Enter>", self._on_child_enter, add="+")
         
-        # Update animation controls state after UI is built
-        self.after(100, self._update_animation_controls)
+        # Emoji picker window, built on first use and then reused
+        self._emoji_picker = None
+        self._emoji_target = None
         
-        # Force scrollbar to be visible after UI is built
-        self.after(200, self._ensure_scrollbar_visible)
+        self.build_ui(allow_delete)
         
         self.grab_set()
         self.transient(master)
@@ -253,76 +248,203 @@ class ButtonSettingsDialog(tk.Toplevel):
         self.bind('<Escape>', lambda e: self.destroy())
         self.apply_theme(theme)
 
-    def _on_frame_configure(self):
-        # Update scrollregion to fit content
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def _color_buttons_state(self):
+        """State for the color pickers: off while the default colors are used."""
+        return "disabled" if self.use_default_colors_var.get() else "normal"
 
-    def _on_canvas_configure(self):
-        # Make the frame width match the canvas width
-        self.canvas.itemconfig(self.content_window, width=self.canvas.winfo_width())
+    def on_default_colors_toggle(self):
+        state = self._color_buttons_state()
+        self.bg_btn.config(state=state)
+        self.fg_btn.config(state=state)
 
-    def _on_dialog_resize(self):
-        # When dialog is resized, update canvas/frame width
-        self._on_canvas_configure()
+    def on_animation_settings_toggle(self):
+        """Handle animation setting changes."""
+        self._update_animation_controls()
 
-    def _bind_mousewheel(self):
-        """Bind mouse wheel events for scrolling."""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_to_mousewheel(event):
-            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        def _unbind_from_mousewheel(event):
-            self.canvas.unbind_all("<MouseWheel>")
-        
-        # Bind when mouse enters the canvas area
-        self.canvas.bind('<Enter>', _bind_to_mousewheel)
-        self.canvas.bind('<Leave>', _unbind_from_mousewheel)
+    def _animation_controls_state(self):
+        """State for the animation picker and preview button."""
+        # Custom controls are only enabled when animation is on for this
+        # button and it doesn't use the default animation
+        if self.disable_animation_var.get() or self.use_default_animation_var.get():
+            return "disabled"
+        return "normal"
 
-    def _ensure_scrollbar_visible(self):
-        """Ensure the scrollbar is always visible."""
+    def _update_animation_controls(self):
+        """Update animation controls state based on checkboxes."""
+        state = self._animation_controls_state()
+        self.animation_menu.config(state=state)
+        self.preview_btn.config(state=state)
+
+    def preview_animation(self):
+        """Preview the selected animation on a test button."""
         try:
-            # Force the scrollbar to be visible by updating the scrollregion
-            self.canvas.update_idletasks()
-            bbox = self.canvas.bbox("all")
-            if bbox:
-                self.canvas.configure(scrollregion=bbox)
-            else:
-                # If no content, set a minimum scrollregion to force scrollbar visibility
-                self.canvas.configure(scrollregion=(0, 0, 0, 1000))
+            # Get animation type code and display name
+            animation_display = self.animation_type_var.get()
+            animation_code = self._animation_code
+            
+            logger.debug(f"Button settings preview animation called - display: '{animation_display}', code: '{animation_code}'")
+            logger.debug(f"Available mappings: {self.animation_display_to_code}")
+            
+            # Create a preview window
+            preview_window = tk.Toplevel(self)
+            preview_window.title(animation_display)
+            preview_window.geometry("280x200")
+            preview_window.configure(bg=self.theme["bg"])
+            preview_window.transient(self)
+            preview_window.grab_set()
+            preview_window.resizable(False, False)
+            
+            # Keep window border and ensure it's on top
+            preview_window.attributes('-topmost', True)
+            
+            # Center the window
+            preview_window.update_idletasks()
+            x = (preview_window.winfo_screenwidth() // 2) - (280 // 2)
+            y = (preview_window.winfo_screenheight() // 2) - (200 // 2)
+            preview_window.geometry(f"280x200+{x}+{y}")
+            
+            # Create main container
+            main_frame = tk.Frame(preview_window, bg=self.theme["bg"])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            
+            # Animation button with the animation name
+            test_button = tk.Button(main_frame, text=animation_display, 
+                                  bg=self.theme["button_bg"], fg=self.theme["button_fg"],
+                                  font=("Segoe UI", 10), relief=tk.FLAT, bd=0,
+                                  width=15, height=2)
+            test_button.pack(expand=True)
+            
+            # Store original background for hover effects
+            test_button.orig_bg = test_button.cget("bg")
+            
+            # Add hover effects
+            def on_enter(event):
+                test_button.config(bg=self.theme.get("button_hover", test_button.orig_bg))
             
-            # Make sure scrollbar is packed and visible
-            self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            self.scrollbar.lift()  # Bring to front
+            def on_leave(event):
+                test_button.config(bg=test_button.orig_bg)
             
-            # Force scrollbar to maintain its space
-            self.scrollbar.pack_propagate(False)
+            test_button.bind("<Enter>", on_enter)
+            test_button.bind("<Leave>", on_leave)
             
-            # Schedule another check to ensure it stays visible
-            self.after(500, self._ensure_scrollbar_visible)
+            # Button frame for restart and close
+            button_frame = tk.Frame(main_frame, bg=self.theme["bg"])
+            button_frame.pack(pady=(15, 0))
+            
+            def trigger_animation():
+                """Trigger the animation."""
+                # Use center of button for ripple effect
+                center_x = test_button.winfo_width() // 2
+                center_y = test_button.winfo_height() // 2
+                animate_button_press(test_button, center_x, center_y, animation_type=animation_code)
+            
+            # Restart button
+            restart_btn = tk.Button(button_frame, text="🔄", command=trigger_animation,
+                                  bg=self.theme["button_bg"], fg=self.theme["button_fg"],
+                                  font=("Segoe UI", 10), relief=tk.FLAT, bd=0,
+                                  width=3, height=1)
+            restart_btn.pack(side=tk.LEFT, padx=(0, 8))
+            
+            # Close button
+            close_btn = tk.Button(button_frame, text="✕", command=preview_window.destroy,
+                                bg=self.theme["button_bg"], fg=self.theme["button_fg"],
+                                font=("Segoe UI", 10), relief=tk.FLAT, bd=0,
+                                width=3, height=1)
+            close_btn.pack(side=tk.LEFT)
+            
+            # Trigger animation immediately
+            preview_window.after_idle(trigger_animation)
             
         except Exception as e:
-            logger.error(f"Error ensuring scrollbar visibility: {e}")
+            logger.warning(f"Animation preview failed: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _preview_animation_click(self):
+        logger.debug("Button settings preview button clicked!")
+        self.preview_animation()
+
+    def _clear_icon(self):
+        self.icon_var.set("")
+
+    def _lazy_tooltip(self, widget, text):
+        """Attach a tooltip to widget; it is translated and created on first hover."""
+        self._pending_tooltips[widget] = text
+
+    def _on_child_enter(self, event):
+        text = self._pending_tooltips.pop(event.widget, None)
+        if text is not None:
+            # From here on the Tooltip's own bindings take over
+            Tooltip(event.widget, self._t(text))._enter(event)
+
+    def _apply_icon(self):
+        try:
+            self.iconbitmap(ICON_ICO_PATH)
+        except Exception as e:
+            logger.warning(f"Could not set button settings dialog icon: {e}")
+
+    def _t(self, text):
+        """Return the translated text for the current language."""
+        return translation_manager.get_text(text)
+
+    def _schedule_configure(self, event=None):
+        if self._cfg_pending:
+            return
+        self._cfg_pending = True
+        self.after_idle(self._apply_configure)
+
+    def _apply_configure(self):
+        self._cfg_pending = False
+        # Make the frame width match the canvas width
+        w = self.canvas.winfo_width()
+        if w != self._last_canvas_w:
+            self._last_canvas_w = w
+            self.canvas.itemconfig(self.content_window, width=w)
+        # Update scrollregion to fit content; keep a minimum region so the
+        # scrollbar stays active while the content is still empty
+        bbox = self.canvas.bbox("all") or (0, 0, 0, 1000)
+        if bbox != self._last_bbox:
+            self._last_bbox = bbox
+            self.canvas.configure(scrollregion=bbox)
+
+    def _bind_mousewheel(self):
+        """Bind mouse wheel events for scrolling."""
+        def _on_mousewheel(event):
+            if event.num == 4:
+                self.canvas.yview_scroll(-1, "units")
+            elif event.num == 5:
+                self.canvas.yview_scroll(1, "units")
+            else:
+                self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        # Bind on the dialog itself: its bindtag is shared by every child
+        # widget, so wheel events over the fields scroll the canvas too
+        # without touching the application-wide "all" bindings
+        self.bind("<MouseWheel>", _on_mousewheel)
+        self.bind("<Button-4>", _on_mousewheel)
+        self.bind("<Button-5>", _on_mousewheel)
 
     def _init_insert_before_options(self):
-        # Build the list of options for the insert before dropdown
+        # Build the list of options for the insert before dropdown and find
+        # the edited button's position in the same pass
         btns = self.master.config_data.get("buttons", [])
-        self.insert_before_options = []
-        for idx, btn in enumerate(btns):
-            label = btn.get("label", f"Button {idx+1}")
-            self.insert_before_options.append(f"{idx+1}. {label}")
-        self.insert_before_options.append(self.master._("At end"))
+        at_end = self._t("At end")
+        options = []
+        edit_idx = None
+        for idx, btn in enumerate(btns, 1):
+            options.append("%d. %s" % (idx, btn.get("label") or "Button %d" % idx))
+            # btn_cfg is a copy of the edited entry, so match by value
+            if edit_idx is None and self.btn_cfg and btn == self.btn_cfg:
+                edit_idx = idx - 1
+        options.append(at_end)
+        self.insert_before_options = options
+        self._edit_idx = edit_idx
         # Default: at end for add, current position for edit
-        if self.btn_cfg and self.btn_cfg in btns:
-            idx = btns.index(self.btn_cfg)
-            self.insert_before_var.set(self.insert_before_options[idx])
-        else:
-            self.insert_before_var.set(self.master._("At end"))
+        self.insert_before_var.set(options[edit_idx] if edit_idx is not None else at_end)
 
     def browse_script(self):
         """Open file dialog to select a Python script."""
-        file_path = filedialog.askopenfilename(title=self.master._("Select Python Script"), filetypes=[("Python Files", "*.py")])
+        file_path = filedialog.askopenfilename(title=self._t("Select Python Script"), filetypes=[("Python Files", "*.py")])
         if file_path:
             self.script_var.set(file_path)
             
@@ -341,7 +463,7 @@ class ButtonSettingsDialog(tk.Toplevel):
     def browse_app(self):
         """Browse for an application file."""
         filename = filedialog.askopenfilename(
-            title=self.master._("Select Application"),
+            title=self._t("Select Application"),
             filetypes=[("Executable files", "*.exe *.bat *.cmd"), ("All files", "*.*")]
         )
         if filename:
@@ -364,106 +486,118 @@ class ButtonSettingsDialog(tk.Toplevel):
             self.fg_btn.config(fg=color, text=color)
 
     def open_emoji_picker(self, entry_widget):
-        # List of relevant emojis for this app
-        emojis = [
-            "🖥️", "🌐", "🎵", "📤", "⚡", "🔗", "📝", "🔊", "⭐", "❓", "✅", "❌", "🕒", "📅", "🔒", "🔓"
-        ]
-        picker = tk.Toplevel(self)
-        picker.title(self.master._("Pick emoji"))
-        picker.transient(self)
-        picker.resizable(False, False)
-        picker.configure(bg=self.theme["dialog_bg"])
-        
-        # Set window icon
-        try:
-            from src.core.constants import ICON_ICO_PATH
-            picker.iconbitmap(ICON_ICO_PATH)
-        except Exception as e:
-            from src.utils.logger import logger
-            logger.warning(f"Could not set emoji picker icon: {e}")
+        self._emoji_target = entry_widget
+        picker = self._emoji_picker
+        if picker is None or not picker.winfo_exists():
+            picker = self._emoji_picker = self._build_emoji_picker()
         # Place near the entry
         x = entry_widget.winfo_rootx()
         y = entry_widget.winfo_rooty() + entry_widget.winfo_height()
         picker.geometry(f"+{x}+{y}")
+        picker.deiconify()
+        picker.focus_set()
+        picker.grab_set()
+
+    def _build_emoji_picker(self):
+        """Create the (initially hidden) emoji picker window; it is reused on later opens."""
+        picker = tk.Toplevel(self)
+        picker.withdraw()
+        picker.title(self._t("Pick emoji"))
+        picker.transient(self)
+        picker.resizable(False, False)
+        picker.configure(bg=self.theme["dialog_bg"])
         # Emoji grid
-        frame = tk.Frame(picker, bg=self.theme["dialog_bg"])
+        frame = tk.Frame(picker)
         frame.pack(padx=8, pady=8)
         cols = 5
-        for i, emoji in enumerate(emojis):
+        for i, emoji in enumerate(_PICKER_EMOJIS):
             btn = tk.Button(frame, text=emoji, font=("Segoe UI Emoji", 16), width=2, height=1, relief=tk.FLAT, 
-                           bg=self.theme["button_bg"], fg=self.theme["button_fg"], 
-                           command=lambda e=emoji: self._insert_emoji(entry_widget, e, picker))
+                           bg=self.theme["button_bg"], fg=self.theme["button_fg"])
+            btn.emoji = emoji
             btn.grid(row=i//cols, column=i%cols, padx=2, pady=2)
-        # Close on focus out
-        picker.bind("<FocusOut>", lambda e: picker.destroy())
-        picker.grab_set()
+        # Every button carries the picker's bindtag, so one handler serves them all
+        picker.bind("<ButtonRelease-1>", self._emoji_click)
+        # Hide (rather than destroy) on focus out or close
+        picker.bind("<FocusOut>", lambda e: self._hide_emoji_picker())
+        picker.protocol("WM_DELETE_WINDOW", self._hide_emoji_picker)
+        return picker
 
-    def _insert_emoji(self, entry_widget, emoji, picker):
+    def _hide_emoji_picker(self):
+        picker = self._emoji_picker
+        if picker is None or not picker.winfo_exists() or picker.state() == "withdrawn":
+            return
+        picker.grab_release()
+        picker.withdraw()
+        # Hand the modal grab back to the dialog
+        self.grab_set()
+
+    def _emoji_click(self, event):
+        emoji = getattr(event.widget, "emoji", None)
+        if emoji is None:
+            return
+        entry_widget = self._emoji_target
         entry_widget.insert(entry_widget.index(tk.INSERT), emoji)
-        picker.destroy()
+        self._hide_emoji_picker()
 
     def _on_llm_provider_change(self, *args):
         """Handle LLM provider change to show/hide appropriate fields."""
         provider = self.llm_provider_var.get()
         
+        for dropdown in self._model_dropdowns.values():
+            dropdown.pack_forget()
+        
         # Show/hide endpoint field based on provider
         if provider == "azure":
             self.endpoint_entry.pack(padx=10, fill=tk.X, expand=True)
             # For Azure, show text entry for model
-            if self.model_dropdown:
-                self.model_dropdown.pack_forget()
             self.model_entry.pack(padx=10, fill=tk.X, expand=True)
-        elif provider == "litellm":
-            self.endpoint_entry.pack_forget()
-            self.model_entry.pack_forget()
-            if self.model_dropdown:
-                self.model_dropdown.pack_forget()
-            self._create_model_dropdown(provider)
         else:
             self.endpoint_entry.pack_forget()
             # For non-Azure, show dropdown with supported models
             self.model_entry.pack_forget()
-            if self.model_dropdown:
-                self.model_dropdown.pack_forget()
-            self._create_model_dropdown(provider)
+            self._show_model_dropdown(provider)
     
-    def _create_model_dropdown(self, provider):
-        """Create model dropdown for the specified provider."""
-        # Define supported models for each provider
-        models = {
-            "openai": ["gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-3.5-turbo", "gpt-3.5-turbo-16k"],
-            "gemini": ["gemini-pro", "gemini-pro-vision", "gemini-1.5-pro", "gemini-1.5-flash"],
-            "litellm": ["gpt-3.5-turbo", "gpt-4", "claude-3-opus", "mixtral-8x7b"]
-        }
-        
-        if provider in models:
-            # Create dropdown
-            self.model_dropdown = tk.OptionMenu(self.dynamic_frame, self.model_var, *models[provider])
-            self.model_dropdown.config(bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], highlightthickness=0)
-            self.model_dropdown.pack(padx=10, fill=tk.X, expand=True)
-            
-            # Set default model if current model is not in the list
-            if self.model_var.get() not in models[provider]:
-                self.model_var.set(models[provider][0])
+    def _show_model_dropdown(self, provider):
+        """Show the model dropdown for the specified provider, creating it on first use."""
+        models = _LLM_MODELS.get(provider)
+        if not models:
+            return
+        dropdown = self._model_dropdowns.get(provider)
+        if dropdown is None:
+            dropdown = self._build_choice_menu(self._type_frames["llm"], self.model_var, models)
+            dropdown.config(**self._menu_kw)
+            self._model_dropdowns[provider] = dropdown
+        dropdown.pack(padx=10, fill=tk.X, expand=True)
+        
+        # Set default model if current model is not in the list
+        if self.model_var.get() not in models:
+            self.model_var.set(models[0])
     
     def _add_mcp_proxy_entry(self):
         """Add a new LLM proxy entry field."""
-        # Create frame for this proxy entry
-        proxy_frame = tk.Frame(self.mcp_frame, bg=self.theme["dialog_bg"])
-        proxy_frame.pack(fill=tk.X, pady=2)
-        
-        # Create entry widget
-        proxy_var = tk.StringVar()
-        proxy_entry = tk.Entry(proxy_frame, textvariable=proxy_var)
-        proxy_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create delete button (only show if more than one entry)
-        delete_btn = tk.Button(proxy_frame, text="🗑️", command=lambda: self._remove_mcp_proxy_entry(proxy_frame, proxy_var),
-                              bg="#a33", fg="white", relief=tk.FLAT, width=3)
-        delete_btn.pack(side=tk.RIGHT)
+        if self._mcp_entry_pool:
+            # Reuse a previously removed row
+            proxy_frame, proxy_var, proxy_entry, delete_btn = row = self._mcp_entry_pool.pop()
+            proxy_var.set("")
+            proxy_frame.pack(fill=tk.X, pady=2)
+        else:
+            # Create frame for this proxy entry
+            proxy_frame = tk.Frame(self.mcp_frame)
+            proxy_frame.pack(fill=tk.X, pady=2)
+            
+            # Create entry widget
+            proxy_var = tk.StringVar()
+            proxy_entry = tk.Entry(proxy_frame, textvariable=proxy_var)
+            proxy_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+            
+            # Create delete button (only show if more than one entry)
+            delete_btn = tk.Button(proxy_frame, text="🗑️", command=lambda: self._remove_mcp_proxy_entry(proxy_frame, proxy_var),
+                                  bg="#a33", fg="white", relief=tk.FLAT, width=3)
+            delete_btn.pack(side=tk.RIGHT)
+            row = (proxy_frame, proxy_var, proxy_entry, delete_btn)
         
         # Store reference
-        self.mcp_entries.append((proxy_frame, proxy_var, proxy_entry, delete_btn))
+        self.mcp_entries[id(proxy_frame)] = row
         
         # Show/hide delete buttons based on number of entries
         self._update_mcp_delete_buttons()
@@ -474,18 +608,20 @@ class ButtonSettingsDialog(tk.Toplevel):
 
     def _remove_mcp_proxy_entry(self, proxy_frame, proxy_var):
         """Remove an LLM proxy entry field."""
-        # Remove from our list
-        self.mcp_entries = [(frame, var, entry, btn) for frame, var, entry, btn in self.mcp_entries if frame != proxy_frame]
+        # Remove from our entries
+        row = self.mcp_entries.pop(id(proxy_frame), None)
         
-        # Destroy the frame
-        proxy_frame.destroy()
+        # Hide the frame and keep it for the next added entry
+        proxy_frame.pack_forget()
+        if row is not None:
+            self._mcp_entry_pool.append(row)
         
         # Update delete buttons visibility
         self._update_mcp_delete_buttons()
 
     def _update_mcp_delete_buttons(self):
         """Update visibility of delete buttons based on number of entries."""
-        for i, (frame, var, entry, delete_btn) in enumerate(self.mcp_entries):
+        for frame, var, entry, delete_btn in self.mcp_entries.values():
             # Show delete button only if there's more than one entry
             if len(self.mcp_entries) > 1:
                 delete_btn.pack(side=tk.RIGHT)
@@ -495,7 +631,7 @@ class ButtonSettingsDialog(tk.Toplevel):
     def _collect_mcp_proxies(self):
         """Collect all LLM proxy values from the UI."""
         proxies = []
-        for frame, var, entry, btn in self.mcp_entries:
+        for frame, var, entry, btn in self.mcp_entries.values():
             value = var.get().strip()
             if value:  # Only add non-empty values
                 proxies.append(value)
@@ -504,9 +640,9 @@ class ButtonSettingsDialog(tk.Toplevel):
     # Removed _resize_to_fit method - users should scroll instead of auto-resizing
 
     def _add_header_row(self, key='', value=''):
-        if not hasattr(self, 'headers_frame') or not self.headers_frame.winfo_exists():
+        if self.headers_frame is None or not self.headers_frame.winfo_exists():
             return
-        row = tk.Frame(self.headers_frame, bg=self.theme["dialog_bg"])
+        row = tk.Frame(self.headers_frame)
         key_var = tk.StringVar(value=key)
         value_var = tk.StringVar(value=value)
         key_entry = tk.Entry(row, textvariable=key_var, width=12)
@@ -516,18 +652,15 @@ class ButtonSettingsDialog(tk.Toplevel):
         value_entry.pack(side=tk.LEFT, padx=(0,4))
         remove_btn.pack(side=tk.LEFT)
         row.pack(fill=tk.X, padx=10, pady=2)
-        self.header_rows.append((row, key_var, value_var))
+        self.header_rows[id(row)] = (row, key_var, value_var)
 
     def _remove_header_row(self, row):
-        for i, (r, _, _) in enumerate(self.header_rows):
-            if r == row:
-                r.destroy()
-                self.header_rows.pop(i)
-                break
+        self.header_rows.pop(id(row), None)
+        row.destroy()
 
     def _collect_headers(self):
         headers_str = ''
-        for _, key_var, value_var in self.header_rows:
+        for _, key_var, value_var in self.header_rows.values():
             k = key_var.get().strip()
             v = value_var.get().strip()
             if k:
@@ -538,11 +671,11 @@ class ButtonSettingsDialog(tk.Toplevel):
         f = self.content_frame
         
         # --- General Settings Group ---
-        general_group = tk.LabelFrame(f, text=self.master._("General"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], bd=1, relief=tk.GROOVE, labelanchor='nw')
+        general_group = tk.LabelFrame(f, text=self._t("General"), bd=1, relief=tk.GROOVE, labelanchor='nw')
         general_group.pack(fill=tk.X, padx=8, pady=(10, 16))
         
-        tk.Label(general_group, text=self.master._("Button Label (text or emoji):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-        label_frame = tk.Frame(general_group, bg=self.theme["dialog_bg"])
+        tk.Label(general_group, text=self._t("Button Label (text or emoji):")).pack(anchor="w", padx=10, pady=(10,0))
+        label_frame = tk.Frame(general_group)
         label_frame.pack(padx=10, fill=tk.X)
         label_entry = tk.Entry(label_frame, textvariable=self.label_var)
         label_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -551,460 +684,527 @@ class ButtonSettingsDialog(tk.Toplevel):
         emoji_btn = tk.Button(label_frame, text="😊", width=2, command=lambda: self.open_emoji_picker(label_entry), 
                              bg=self.theme["dialog_bg"], fg=self.theme["button_fg"], relief=tk.FLAT)
         emoji_btn.pack(side=tk.LEFT, padx=(4,0))
-        Tooltip(emoji_btn, self.master._("Pick emoji"))
+        self._lazy_tooltip(emoji_btn, "Pick emoji")
         
-        tk.Label(general_group, text=self.master._("Tooltip (optional):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(6,0))
+        tk.Label(general_group, text=self._t("Tooltip (optional):")).pack(anchor="w", padx=10, pady=(6,0))
         tooltip_entry = tk.Entry(general_group, textvariable=self.tooltip_var)
         tooltip_entry.pack(padx=10, fill=tk.X, pady=(0,12))
         
         # --- Action Settings Group ---
-        action_group = tk.LabelFrame(f, text=self.master._("Action"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], bd=1, relief=tk.GROOVE, labelanchor='nw')
+        action_group = tk.LabelFrame(f, text=self._t("Action"), bd=1, relief=tk.GROOVE, labelanchor='nw')
         action_group.pack(fill=tk.BOTH, padx=8, pady=(0, 16), expand=True)
         
         # Type selector with translated display names
-        tk.Label(action_group, text=self.master._("Button Type:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-        self.type_code_to_disp = {
-            # Core execution types
-            "python_script": self.master._("Python Script"),
-            "app_launcher": self.master._("Application Launcher"),
-            "shell": self.master._("Run Shell Command"),
-            
-            # Web & communication
-            "website": self.master._("Open Website"),
-            "post": self.master._("POST Request"),
-            "llm": self.master._("LLM Chat"),
-            
-            # Media & entertainment
-            "music": self.master._("Play Music"),
-            
-            # Monitoring & testing
-            "timer": self.master._("Timer"),
-            "pomodoro": self.master._("Pomodoro Timer"),
-            "ping": self.master._("Ping"),
-            "network_speed": self.master._("Network Speed Test"),
-            "http_test": self.master._("HTTP Test"),
-            "color_picker": self.master._("Color Picker")
-        }
-        self.type_disp_to_code = {v: k for k, v in self.type_code_to_disp.items()}
+        tk.Label(action_group, text=self._t("Button Type:")).pack(anchor="w", padx=10, pady=(10,0))
+        self.type_code_to_disp, self.type_disp_to_code = _type_labels(translation_manager.current_language)
         self.type_display = tk.StringVar()
         # Set display value based on code
-        self.type_display.set(self.type_code_to_disp.get(self.type_var.get(), self.master._("Python Script")))
-        type_menu = tk.OptionMenu(action_group, self.type_display, *self.type_disp_to_code.keys())
-        type_menu.config(bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], highlightthickness=0)
+        self.type_display.set(self.type_code_to_disp.get(self.type_var.get(), self._t("Python Script")))
+        type_menu = self._build_choice_menu(action_group, self.type_display, self.type_disp_to_code.keys(),
+                                            command=self._on_type_pick)
+        type_menu.config(**self._menu_kw)
         type_menu.pack(padx=10, fill=tk.X)
         
-        # When display value changes, update type_var
-        def on_type_display_change(*args):
-            code = self.type_disp_to_code.get(self.type_display.get(), "python_script")
-            self.type_var.set(code)
-        self.type_display.trace_add("write", on_type_display_change)
-        
-        # When type_var changes, update display value (for programmatic changes)
-        def on_type_var_change(*args):
-            disp = self.type_code_to_disp.get(self.type_var.get(), self.master._("Python Script"))
-            if self.type_display.get() != disp:
-                self.type_display.set(disp)
-        self.type_var.trace_add("write", on_type_var_change)
-        
         # --- Dynamic fields frame ---
-        self.dynamic_frame = tk.Frame(action_group, bg=self.theme["dialog_bg"])
+        self.dynamic_frame = tk.Frame(action_group)
         self.dynamic_frame.pack(fill=tk.X, padx=0, pady=0)
+        # One cached subframe per button type, built the first time it is shown
+        self._type_frames = {}
+        self._shown_type_frame = None
+        self._shown_type = None
+        self._warm_id = None
+        self._type_save_handlers = {}
         
         # Add a blank spacer at the bottom for extra padding
-        self.action_group_spacer = tk.Frame(action_group, height=8, bg=self.theme["dialog_bg"])
+        self.action_group_spacer = tk.Frame(action_group, height=8)
         self.action_group_spacer.pack(fill=tk.X, padx=0, pady=(0,12))
         
         # --- Styling Group ---
-        styling_group = tk.LabelFrame(f, text=self.master._("Styling"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], bd=1, relief=tk.GROOVE, labelanchor='nw')
+        styling_group = tk.LabelFrame(f, text=self._t("Styling"), bd=1, relief=tk.GROOVE, labelanchor='nw')
         styling_group.pack(fill=tk.X, padx=8, pady=(0, 16))
         
-        tk.Label(styling_group, text=self.master._("Icon Path:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-        icon_row = tk.Frame(styling_group, bg=self.theme["dialog_bg"])
+        tk.Label(styling_group, text=self._t("Icon Path:")).pack(anchor="w", padx=10, pady=(10,0))
+        icon_row = tk.Frame(styling_group)
         icon_row.pack(padx=10, fill=tk.X)
         icon_entry = tk.Entry(icon_row, textvariable=self.icon_var)
         icon_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        browse_icon_btn = tk.Button(icon_row, text=self.master._("Browse..."), command=self.browse_icon, 
-                                   bg=self.theme["button_bg"], fg=self.theme["button_fg"], relief=tk.FLAT)
+        browse_icon_btn = tk.Button(icon_row, text=self._t("Browse..."), command=self.browse_icon, **self._btn_kw)
         browse_icon_btn.pack(side=tk.LEFT, padx=(4,0))
-        del_icon_btn = tk.Button(icon_row, text="🗑️", command=lambda: self.icon_var.set(""), bg="#a33", fg="white", relief=tk.FLAT)
+        del_icon_btn = tk.Button(icon_row, text="🗑️", command=self._clear_icon, bg="#a33", fg="white", relief=tk.FLAT)
         del_icon_btn.pack(side=tk.LEFT, padx=(4,0))
-        Tooltip(browse_icon_btn, self.master._("Browse for icon image"))
-        Tooltip(del_icon_btn, self.master._("Clear icon path"))
+        self._lazy_tooltip(browse_icon_btn, "Browse for icon image")
+        self._lazy_tooltip(del_icon_btn, "Clear icon path")
         
         # Default color checkbox (placed just above color settings)
-        default_colors_cb = tk.Checkbutton(styling_group, text=self.master._("Use default colors (auto swap in dark mode)"), 
-                                          variable=self.use_default_colors_var, bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], 
-                                          selectcolor=self.theme["dialog_bg"], activebackground=self.theme["dialog_bg"], 
-                                          activeforeground=self.theme["label_fg"], command=self.on_default_colors_toggle)
+        default_colors_cb = tk.Checkbutton(styling_group, text=self._t("Use default colors (auto swap in dark mode)"), 
+                                          variable=self.use_default_colors_var, command=self.on_default_colors_toggle, **self._check_kw)
         default_colors_cb.pack(anchor="w", padx=10, pady=(10,0))
         
-        tk.Label(styling_group, text=self.master._("Button Background Color:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-        self.bg_btn = tk.Button(styling_group, text=self.bg_color, bg=self.bg_color, fg=self.theme["button_fg"], command=self.pick_bg_color)
+        # Widgets are created in their initial state instead of reconfigured afterwards
+        color_state = self._color_buttons_state()
+        tk.Label(styling_group, text=self._t("Button Background Color:")).pack(anchor="w", padx=10, pady=(10,0))
+        self.bg_btn = tk.Button(styling_group, text=self.bg_color, bg=self.bg_color, fg=self.theme["button_fg"],
+                                command=self.pick_bg_color, state=color_state)
         self.bg_btn.pack(padx=10, pady=2, anchor="w")
         
-        tk.Label(styling_group, text=self.master._("Button Text Color:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-        self.fg_btn = tk.Button(styling_group, text=self.fg_color, bg=self.theme["dialog_bg"], fg=self.fg_color, command=self.pick_fg_color)
+        tk.Label(styling_group, text=self._t("Button Text Color:")).pack(anchor="w", padx=10, pady=(10,0))
+        self.fg_btn = tk.Button(styling_group, text=self.fg_color, bg=self.theme["dialog_bg"], fg=self.fg_color,
+                                command=self.pick_fg_color, state=color_state)
         self.fg_btn.pack(padx=10, pady=(2,12), anchor="w")
         
-        self.on_default_colors_toggle()
-        
         # --- Animation Settings ---
         # Disable animation checkbox (highest priority)
-        disable_animation_cb = tk.Checkbutton(styling_group, text=self.master._("Disable animation for this button"), 
-                                            variable=self.disable_animation_var, bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], 
-                                            selectcolor=self.theme["dialog_bg"], activebackground=self.theme["dialog_bg"], 
-                                            activeforeground=self.theme["label_fg"], command=self.on_animation_settings_toggle)
+        disable_animation_cb = tk.Checkbutton(styling_group, text=self._t("Disable animation for this button"), 
+                                            variable=self.disable_animation_var, command=self.on_animation_settings_toggle, **self._check_kw)
         disable_animation_cb.pack(anchor="w", padx=10, pady=(10,0))
         
         # Default animation checkbox
-        default_animation_cb = tk.Checkbutton(styling_group, text=self.master._("Use default animation (from settings)"), 
-                                            variable=self.use_default_animation_var, bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], 
-                                            selectcolor=self.theme["dialog_bg"], activebackground=self.theme["dialog_bg"], 
-                                            activeforeground=self.theme["label_fg"], command=self.on_animation_settings_toggle)
+        default_animation_cb = tk.Checkbutton(styling_group, text=self._t("Use default animation (from settings)"), 
+                                            variable=self.use_default_animation_var, command=self.on_animation_settings_toggle, **self._check_kw)
         default_animation_cb.pack(anchor="w", padx=10, pady=(5,0))
         
         # Animation type selection
-        tk.Label(styling_group, text=self.master._("Animation Type:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-        animation_frame = tk.Frame(styling_group, bg=self.theme["dialog_bg"])
+        tk.Label(styling_group, text=self._t("Animation Type:")).pack(anchor="w", padx=10, pady=(10,0))
+        animation_frame = tk.Frame(styling_group)
         animation_frame.pack(padx=10, fill=tk.X, pady=(0, 12))
         
-        # Create animation options with translated names
-        animation_options = [
-            ("ripple", self.master._("Ripple Effect")),
-            ("scale", self.master._("Scale Down")),
-            ("glow", self.master._("Glow Effect")),
-            ("bounce", self.master._("Bounce")),
-            ("shake", self.master._("Shake")),
-            ("flame", self.master._("Flame Burst")),
-            ("confetti", self.master._("Confetti Burst")),
-            ("sparkle", self.master._("Sparkle Effect")),
-            ("explosion", self.master._("Explosion")),
-            ("combined", self.master._("Combined (Scale + Glow)"))
-        ]
-        self.animation_display_to_code = {display: code for code, display in animation_options}
-        self.animation_code_to_display = {code: display for code, display in animation_options}
-        
-        # Set the display value based on current animation type
-        current_animation = self.animation_type_var.get()
-        current_display = self.animation_code_to_display.get(current_animation, self.master._("Ripple Effect"))
-        self.animation_type_var.set(current_display)
-        
-        self.animation_menu = tk.OptionMenu(animation_frame, self.animation_type_var, *[opt[1] for opt in animation_options])
-        self.animation_menu.config(bg=self.theme["button_bg"], fg=self.theme["button_fg"], highlightthickness=0)
+        # Animation options with translated names
+        self.animation_code_to_display, self.animation_display_to_code = _animation_labels(
+            translation_manager.current_language)
+        
+        # Set the display value based on current animation type; the picked
+        # code is tracked in _animation_code so save and preview need no lookup
+        current_animation = self.btn_cfg.get("animation_type", "ripple")
+        if current_animation not in self.animation_code_to_display:
+            current_animation = "ripple"
+        self._animation_code = current_animation
+        self.animation_type_var.set(self.animation_code_to_display[current_animation])
+        
+        self.animation_menu = self._build_choice_menu(animation_frame, self.animation_type_var,
+                                                      self.animation_code_to_display.values(),
+                                                      command=self._on_animation_pick)
+        animation_state = self._animation_controls_state()
+        self.animation_menu.config(bg=self.theme["button_bg"], fg=self.theme["button_fg"], highlightthickness=0,
+                                   state=animation_state)
         self.animation_menu.pack(side=tk.LEFT)
         
         # Animation preview button
-        def preview_clicked():
-            logger.debug("Button settings preview button clicked!")
-            self.preview_animation()
-        
-        self.preview_btn = tk.Button(animation_frame, text=self.master._("Preview"), command=preview_clicked,
-                                   bg=self.theme["button_bg"], fg=self.theme["button_fg"], relief=tk.FLAT)
+        self.preview_btn = tk.Button(animation_frame, text=self._t("Preview"), command=self._preview_animation_click,
+                                     state=animation_state, **self._btn_kw)
         self.preview_btn.pack(side=tk.LEFT, padx=(8, 0))
-        Tooltip(self.preview_btn, self.master._("Preview the selected animation"))
+        self._lazy_tooltip(self.preview_btn, "Preview the selected animation")
         
         # Create the fixed bottom buttons after UI is built
         self._create_bottom_buttons(allow_delete)
         
         self.update_fields()
+        self._warm_id = self.after_idle(self._warm_common_types)
 
     def _create_bottom_buttons(self, allow_delete):
         """Create the fixed bottom action buttons (Save, Duplicate, Delete)."""
         # --- Save/Delete/Duplicate buttons ---
-        btn_frame = tk.Frame(self.bottom_frame, bg=self.theme["dialog_bg"])
+        btn_frame = tk.Frame(self.bottom_frame)
         btn_frame.pack(pady=(0, 5), padx=10, fill=tk.X)
         
         # Save button with disk icon
         save_btn = tk.Button(btn_frame, text="💾 Save", command=self.save, bg=self.theme["button_bg"], fg=self.theme["button_fg"], 
                            font=("Segoe UI", 10, "bold"), relief=tk.FLAT, height=1)
         save_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, ipadx=5, ipady=3)
-        Tooltip(save_btn, self.master._("Save button settings"))
+        self._lazy_tooltip(save_btn, "Save button settings")
         
         # Duplicate button
         dup_btn = tk.Button(btn_frame, text="📋 Duplicate", command=self.duplicate, bg=self.theme["button_bg"], fg=self.theme["button_fg"], 
                           font=("Segoe UI", 10, "bold"), relief=tk.FLAT, height=1)
         dup_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, ipadx=5, ipady=3, padx=(8,0))
-        Tooltip(dup_btn, self.master._("Create a copy of this button"))
+        self._lazy_tooltip(dup_btn, "Create a copy of this button")
         
         if allow_delete:
             del_btn = tk.Button(btn_frame, text="🗑️ Delete", command=self.delete, bg="#a33", fg="white", 
                               font=("Segoe UI", 10, "bold"), relief=tk.FLAT, height=1)
             del_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, ipadx=5, ipady=3, padx=(8,0))
-            Tooltip(del_btn, self.master._("Delete this button"))
+            self._lazy_tooltip(del_btn, "Delete this button")
 
-    def update_fields(self):
-        """Show/hide fields based on button type."""
-        self._updating_fields = True
+    def _build_choice_menu(self, parent, variable, choices, command=None):
+        """
+        Create an OptionMenu-style picker for ``variable``.
+        
+        Unlike tk.OptionMenu, which registers a Tcl callback per entry, the
+        entries are radiobuttons bound straight to the variable and share a
+        single registered ``command`` (called without arguments).
+        """
+        picker = tk.Menubutton(parent, textvariable=variable, indicatoron=True, relief=tk.RAISED,
+                               borderwidth=2, anchor="c", highlightthickness=2)
+        menu = tk.Menu(picker, tearoff=0)
+        picker["menu"] = menu
+        extra = {"command": self.register(command)} if command else {}
+        for choice in choices:
+            menu.add_radiobutton(label=choice, variable=variable, value=choice, **extra)
+        return picker
+
+    def _add_row(self, parent, label, var, show=None, pady=(10,0)):
+        """Add a label with a full-width entry for ``var`` below it and return the entry."""
+        tk.Label(parent, text=label).pack(anchor="w", padx=10, pady=pady)
+        entry = tk.Entry(parent, textvariable=var, show=show) if show else tk.Entry(parent, textvariable=var)
+        entry.pack(padx=10, fill=tk.X, expand=True)
+        return entry
+
+    @staticmethod
+    def _int_or(var, default):
+        """Return the integer in ``var``, or ``default`` if it does not hold one."""
         try:
-            t = self.type_var.get()
-            # Remove all widgets from dynamic_frame to ensure a clean redraw
-            for child in self.dynamic_frame.winfo_children():
-                if child.winfo_exists():
-                    child.destroy()
-            
-            # Now create and pack widgets for the selected type
-            if t == "python_script":
-                tk.Label(self.dynamic_frame, text=self.master._("Python Script Path:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                script_entry = tk.Entry(self.dynamic_frame, textvariable=self.script_var)
-                script_entry.pack(padx=10, fill=tk.X, expand=True)
-                script_browse = tk.Button(self.dynamic_frame, text="Browse...", command=self.browse_script)
-                script_browse.pack(padx=10, pady=2, anchor="e")
-                
-                tk.Label(self.dynamic_frame, text=self.master._("Arguments (wildcards: {date}, {time}, {datetime}):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                args_entry = tk.Entry(self.dynamic_frame, textvariable=self.args_var)
-                args_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Add background option
-                self.background_var = tk.BooleanVar(value=self.btn_cfg.get("background", False))
-                background_check = tk.Checkbutton(self.dynamic_frame, text=self.master._("Run in background (minimized)"), 
-                                                variable=self.background_var, bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], 
-                                                selectcolor=self.theme["dialog_bg"], activebackground=self.theme["dialog_bg"], 
-                                                activeforeground=self.theme["label_fg"])
-                background_check.pack(anchor="w", padx=10, pady=(2,8))
-                
-            elif t == "website":
-                tk.Label(self.dynamic_frame, text=self.master._("Website URL:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                url_entry = tk.Entry(self.dynamic_frame, textvariable=self.url_var)
-                url_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-            elif t == "music":
-                tk.Label(self.dynamic_frame, text=self.master._("Music File:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                music_entry = tk.Entry(self.dynamic_frame, textvariable=self.music_var)
-                music_entry.pack(padx=10, fill=tk.X, expand=True)
-                music_browse = tk.Button(self.dynamic_frame, text="Browse...", command=self.browse_music)
-                music_browse.pack(padx=10, pady=2, anchor="e")
-                
-            elif t == "post":
-                tk.Label(self.dynamic_frame, text=self.master._("POST URL:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.post_url_entry = tk.Entry(self.dynamic_frame)
-                self.post_url_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                tk.Label(self.dynamic_frame, text=self.master._("Headers (key: value per line):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.headers_frame = tk.Frame(self.dynamic_frame, bg=self.theme["dialog_bg"])
-                self.headers_frame.pack(fill=tk.X, padx=0, pady=0)
-                
-                add_header_btn = tk.Button(self.dynamic_frame, text="➕ " + self.master._("Add header"), command=self._add_header_row, 
-                                         bg=self.theme["button_bg"], fg=self.theme["button_fg"], relief=tk.FLAT)
-                add_header_btn.pack(padx=10, pady=(0,4), anchor="w")
-                
-                tk.Label(self.dynamic_frame, text=self.master._("Body (optional):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.post_body_text = tk.Text(self.dynamic_frame, height=3, width=30)
-                self.post_body_text.pack(padx=10, fill=tk.X, expand=True)
-                
-                if not self.header_rows:
-                    self._add_header_row()
-                    
-            elif t == "shell":
-                tk.Label(self.dynamic_frame, text=self.master._("Shell Command:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.shell_var = tk.StringVar(value=self.btn_cfg.get("shell_cmd", ""))
-                shell_entry = tk.Entry(self.dynamic_frame, textvariable=self.shell_var)
-                shell_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-            elif t == "timer":
-                tk.Label(self.dynamic_frame, text=self.master._("Timer Duration (h:mm:ss):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.timer_duration_var = tk.StringVar(value=self.btn_cfg.get("timer_duration", "0:01:00"))
-                timer_duration_entry = tk.Entry(self.dynamic_frame, textvariable=self.timer_duration_var)
-                timer_duration_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-            elif t == "llm":
-                # Add LLM specific fields
-                tk.Label(self.dynamic_frame, text=self.master._("LLM Provider:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.llm_provider_var = tk.StringVar(value=self.btn_cfg.get("llm_provider", "openai"))
-                provider_options = ["openai", "azure", "gemini", "litellm"]
-                provider_menu = tk.OptionMenu(self.dynamic_frame, self.llm_provider_var, *provider_options, command=self._on_llm_provider_change)
-                provider_menu.config(bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], highlightthickness=0)
-                provider_menu.pack(padx=10, fill=tk.X, pady=(0,6))
-                
-                # Endpoint URL field (for Azure)
-                tk.Label(self.dynamic_frame, text=self.master._("Endpoint URL:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(6,0))
-                self.endpoint_var = tk.StringVar(value=self.btn_cfg.get("llm_endpoint", ""))
-                self.endpoint_entry = tk.Entry(self.dynamic_frame, textvariable=self.endpoint_var)
-                self.endpoint_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                tk.Label(self.dynamic_frame, text=self.master._("API Key:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(6,0))
-                self.api_key_var = tk.StringVar(value=self.btn_cfg.get("llm_api_key", ""))
-                api_key_entry = tk.Entry(self.dynamic_frame, textvariable=self.api_key_var, show="*")
-                api_key_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-
-                
-                # Model field - textbox for Azure, dropdown for others
-                tk.Label(self.dynamic_frame, text=self.master._("Model:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(6,0))
-                self.model_var = tk.StringVar(value=self.btn_cfg.get("llm_model", "gpt-3.5-turbo"))
-                self.model_entry = tk.Entry(self.dynamic_frame, textvariable=self.model_var)
-                self.model_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Model dropdown for non-Azure providers
-                self.model_dropdown = None
-                
-                tk.Label(self.dynamic_frame, text=self.master._("Context (system prompt):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(6,0))
-                self.context_text = tk.Text(self.dynamic_frame, height=3, width=30)
-                self.context_text.insert("1.0", self.btn_cfg.get("llm_context", ""))
-                self.context_text.pack(padx=10, fill=tk.X, expand=True)
-                
-                # MCP/Proxy settings
-                tk.Label(self.dynamic_frame, text=self.master._("MCP/Proxy Settings:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], font=("Segoe UI", 10, "bold")).pack(anchor="w", padx=10, pady=(10,0))
-                
-                # MCP proxies frame
-                self.mcp_frame = tk.Frame(self.dynamic_frame, bg=self.theme["dialog_bg"])
-                self.mcp_frame.pack(fill=tk.X, padx=10, pady=(5,0))
-                
-                # Initialize MCP proxies list
-                self.mcp_proxies = self.btn_cfg.get("llm_proxies", [""])
-                self.mcp_entries = []
-                
-                # Add initial proxy entry
-                self._add_mcp_proxy_entry()
-                
-                # Add new proxy button
-                add_proxy_btn = tk.Button(self.dynamic_frame, text="➕ " + self.master._("Add New Proxy"), 
-                                        command=self._add_mcp_proxy_entry,
-                                        bg=self.theme["button_bg"], fg=self.theme["button_fg"], relief=tk.FLAT)
-                add_proxy_btn.pack(padx=10, pady=(5,0), anchor="w")
-                
-                # Initialize provider-specific UI
-                self._on_llm_provider_change()
-                
-            elif t == "app_launcher":
-                tk.Label(self.dynamic_frame, text=self.master._("Application Path:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                app_path_frame = tk.Frame(self.dynamic_frame, bg=self.theme["dialog_bg"])
-                app_path_frame.pack(padx=10, fill=tk.X, expand=True)
-                self.app_path_var = tk.StringVar(value=self.btn_cfg.get("app_path", ""))
-                app_path_entry = tk.Entry(app_path_frame, textvariable=self.app_path_var)
-                app_path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                browse_app_btn = tk.Button(app_path_frame, text=self.master._("Browse..."), command=self.browse_app, 
-                                         bg=self.theme["button_bg"], fg=self.theme["button_fg"], relief=tk.FLAT)
-                browse_app_btn.pack(side=tk.LEFT, padx=(4,0))
-                
-                tk.Label(self.dynamic_frame, text=self.master._("Arguments (optional):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.app_args_var = tk.StringVar(value=self.btn_cfg.get("args", ""))
-                app_args_entry = tk.Entry(self.dynamic_frame, textvariable=self.app_args_var)
-                app_args_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Background option
-                self.app_background_var = tk.BooleanVar(value=self.btn_cfg.get("background", False))
-                app_background_check = tk.Checkbutton(self.dynamic_frame, text=self.master._("Run in background"), 
-                                                    variable=self.app_background_var, bg=self.theme["dialog_bg"], 
-                                                    fg=self.theme["label_fg"], selectcolor=self.theme["dialog_bg"])
-                app_background_check.pack(anchor="w", padx=10, pady=(5,0))
-                
-            elif t == "network_speed":
-                # Network speed test configuration
-                info_label = tk.Label(self.dynamic_frame, text=self.master._("Click the button to run a network speed test. Results will be displayed on the button."), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left")
-                info_label.pack(anchor="w", padx=10, pady=(10,0))
-                
-            elif t == "ping":
-                # Ping configuration
-                info_label = tk.Label(self.dynamic_frame, text=self.master._("Click the button to ping a host. Results will be displayed on the button."), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left")
-                info_label.pack(anchor="w", padx=10, pady=(10,0))
-                
-                # Host configuration
-                tk.Label(self.dynamic_frame, text=self.master._("Host to ping:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.ping_host_var = tk.StringVar(value=self.btn_cfg.get("ping_host", "8.8.8.8"))
-                ping_host_entry = tk.Entry(self.dynamic_frame, textvariable=self.ping_host_var)
-                ping_host_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Ping count configuration
-                tk.Label(self.dynamic_frame, text=self.master._("Number of pings:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.ping_count_var = tk.StringVar(value=str(self.btn_cfg.get("ping_count", 3)))
-                ping_count_entry = tk.Entry(self.dynamic_frame, textvariable=self.ping_count_var)
-                ping_count_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Help text
-                help_label = tk.Label(self.dynamic_frame, text=self.master._("Enter hostname or IP address (e.g., google.com, 8.8.8.8)"), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left", font=("Segoe UI", 8))
-                help_label.pack(anchor="w", padx=10, pady=(5,0))
-                
-            elif t == "pomodoro":
-                # Pomodoro configuration
-                info_label = tk.Label(self.dynamic_frame, text=self.master._("Click to start Pomodoro timer. Click: start/pause, Right-click: skip, Double-click: reset"), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left")
-                info_label.pack(anchor="w", padx=10, pady=(10,0))
-                
-                # Work duration
-                tk.Label(self.dynamic_frame, text=self.master._("Work Duration (minutes):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.work_duration_var = tk.StringVar(value=str(self.btn_cfg.get("work_duration", 25)))
-                work_duration_entry = tk.Entry(self.dynamic_frame, textvariable=self.work_duration_var)
-                work_duration_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Short break duration
-                tk.Label(self.dynamic_frame, text=self.master._("Short Break (minutes):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.short_break_var = tk.StringVar(value=str(self.btn_cfg.get("short_break_duration", 5)))
-                short_break_entry = tk.Entry(self.dynamic_frame, textvariable=self.short_break_var)
-                short_break_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Long break duration
-                tk.Label(self.dynamic_frame, text=self.master._("Long Break (minutes):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.long_break_var = tk.StringVar(value=str(self.btn_cfg.get("long_break_duration", 15)))
-                long_break_entry = tk.Entry(self.dynamic_frame, textvariable=self.long_break_var)
-                long_break_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Sessions before long break
-                tk.Label(self.dynamic_frame, text=self.master._("Sessions before Long Break:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.sessions_var = tk.StringVar(value=str(self.btn_cfg.get("sessions_before_long_break", 4)))
-                sessions_entry = tk.Entry(self.dynamic_frame, textvariable=self.sessions_var)
-                sessions_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Auto-advance option
-                self.auto_advance_var = tk.BooleanVar(value=self.btn_cfg.get("auto_advance", True))
-                auto_advance_check = tk.Checkbutton(self.dynamic_frame, text=self.master._("Auto-advance between phases"), 
-                                                  variable=self.auto_advance_var, bg=self.theme["dialog_bg"], 
-                                                  fg=self.theme["label_fg"], selectcolor=self.theme["dialog_bg"])
-                auto_advance_check.pack(anchor="w", padx=10, pady=(5,0))
-                
-            elif t == "http_test":
-                # HTTP test configuration
-                info_label = tk.Label(self.dynamic_frame, text=self.master._("Click to test HTTP/HTTPS connectivity. Shows lock status and response time."), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left")
-                info_label.pack(anchor="w", padx=10, pady=(10,0))
-                
-                # Test URL
-                tk.Label(self.dynamic_frame, text=self.master._("Test URL:"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.test_url_var = tk.StringVar(value=self.btn_cfg.get("test_url", "https://google.com"))
-                test_url_entry = tk.Entry(self.dynamic_frame, textvariable=self.test_url_var)
-                test_url_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Timeout
-                tk.Label(self.dynamic_frame, text=self.master._("Timeout (seconds):"), bg=self.theme["dialog_bg"], fg=self.theme["label_fg"]).pack(anchor="w", padx=10, pady=(10,0))
-                self.timeout_var = tk.StringVar(value=str(self.btn_cfg.get("timeout", 10)))
-                timeout_entry = tk.Entry(self.dynamic_frame, textvariable=self.timeout_var)
-                timeout_entry.pack(padx=10, fill=tk.X, expand=True)
-                
-                # Help text
-                help_label = tk.Label(self.dynamic_frame, text=self.master._("🔒 = HTTPS with valid certificate, 🔓 = HTTPS with invalid certificate, 🌐 = HTTP only"), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left", font=("Segoe UI", 8))
-                help_label.pack(anchor="w", padx=10, pady=(5,0))
-                
-            elif t == "color_picker":
-                # Color picker configuration
-                info_label = tk.Label(self.dynamic_frame, text=self.master._("Click to pick a color from anywhere on your screen. The hex color code will be copied to clipboard."), 
-                                    bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left")
-                info_label.pack(anchor="w", padx=10, pady=(10,0))
-                
-                # Instructions
-                instructions_label = tk.Label(self.dynamic_frame, text=self.master._("Workflow: Click button → Click on screen → Color copied to clipboard"), 
-                                            bg=self.theme["dialog_bg"], fg=self.theme["label_fg"], wraplength=300, justify="left", font=("Segoe UI", 8))
-                instructions_label.pack(anchor="w", padx=10, pady=(5,0))
-            
-            # Let users scroll instead of auto-resizing
-        finally:
-            self._updating_fields = False
-            
-        # Ensure scrollbar is visible after fields are updated
-        self.after(50, self._ensure_scrollbar_visible)
+            return int(var.get())
+        except ValueError:
+            return default
+
+    def _on_animation_pick(self):
+        """Remember the code of the animation picked in the menu."""
+        self._animation_code = self.animation_display_to_code.get(self.animation_type_var.get(), "ripple")
+
+    def _on_type_pick(self):
+        """Handle a pick from the type menu: sync type_var and show its fields."""
+        code = self.type_disp_to_code.get(self.type_display.get(), "python_script")
+        if code != self.type_var.get():
+            self.type_var.set(code)
+            self.update_fields()
+
+    def update_fields(self, force=False):
+        """
+        Show the fields for the selected button type, building them on first use.
+        
+        Does nothing when that type is already shown, unless ``force`` is set,
+        in which case the type's fields are rebuilt from the button config.
+        """
+        t = self.type_var.get()
+        if t == self._shown_type and not force:
+            return
+        frame = self._type_frames.get(t)
+        if frame is not None and force:
+            if frame is self._shown_type_frame:
+                self._shown_type_frame = None
+            frame.destroy()
+            frame = None
+        frame = frame or self._build_type_frame(t)
+        if frame is not self._shown_type_frame:
+            # Keep the other types' frames (and their values) around, just hidden
+            if self._shown_type_frame is not None:
+                self._shown_type_frame.pack_forget()
+            frame.pack(fill=tk.X, padx=0, pady=0)
+            self._shown_type_frame = frame
+        self._shown_type = t
+
+    def _warm_common_types(self):
+        """Build the next common type's fields that are not built yet, one type per idle pass."""
+        self._warm_id = None
+        for t in _WARM_TYPES:
+            if t not in self._type_frames:
+                self._build_type_frame(t)
+                self._warm_id = self.after_idle(self._warm_common_types)
+                return
+
+    def _build_type_frame(self, t):
+        """Create and cache the frame holding the fields for button type ``t``."""
+        frame = tk.Frame(self.dynamic_frame)
+        self._type_frames[t] = frame
+        builder = _TYPE_BUILDERS.get(t)
+        if builder:
+            getattr(self, builder)(frame)
+        return frame
+
+    def _build_python_script_fields(self, frame):
+        """Fields for Python script buttons."""
+        self._type_save_handlers["python_script"] = self._collect_python_script_fields
+        self._add_row(frame, self._t("Python Script Path:"), self.script_var)
+        script_browse = tk.Button(frame, text="Browse...", command=self.browse_script)
+        script_browse.pack(padx=10, pady=2, anchor="e")
+        
+        self._add_row(frame, self._t("Arguments (wildcards: {date}, {time}, {datetime}):"), self.args_var)
+        
+        # Add background option
+        self.background_var = tk.BooleanVar(value=self.btn_cfg.get("background", False))
+        background_check = tk.Checkbutton(frame, text=self._t("Run in background (minimized)"), 
+                                        variable=self.background_var, **self._check_kw)
+        background_check.pack(anchor="w", padx=10, pady=(2,8))
+
+    def _collect_python_script_fields(self, cfg):
+        """Add the Python script fields to cfg."""
+        cfg["background"] = self.background_var.get()
+
+    def _build_website_fields(self, frame):
+        """Fields for website buttons."""
+        self._add_row(frame, self._t("Website URL:"), self.url_var)
+
+    def _build_music_fields(self, frame):
+        """Fields for music buttons."""
+        self._add_row(frame, self._t("Music File:"), self.music_var)
+        music_browse = tk.Button(frame, text="Browse...", command=self.browse_music)
+        music_browse.pack(padx=10, pady=2, anchor="e")
+
+    def _build_post_fields(self, frame):
+        """Fields for POST request buttons."""
+        self._type_save_handlers["post"] = self._collect_post_fields
+        tk.Label(frame, text=self._t("POST URL:")).pack(anchor="w", padx=10, pady=(10,0))
+        self.post_url_entry = tk.Entry(frame)
+        self.post_url_entry.pack(padx=10, fill=tk.X, expand=True)
+        
+        tk.Label(frame, text=self._t("Headers (key: value per line):")).pack(anchor="w", padx=10, pady=(10,0))
+        self.headers_frame = tk.Frame(frame)
+        self.headers_frame.pack(fill=tk.X, padx=0, pady=0)
+        
+        add_header_btn = tk.Button(frame, text="➕ " + self._t("Add header"), command=self._add_header_row, **self._btn_kw)
+        add_header_btn.pack(padx=10, pady=(0,4), anchor="w")
+        
+        tk.Label(frame, text=self._t("Body (optional):")).pack(anchor="w", padx=10, pady=(10,0))
+        self.post_body_text = tk.Text(frame, height=3, width=30)
+        self.post_body_text.pack(padx=10, fill=tk.X, expand=True)
+        
+        # Start from a single empty row; rows of a previous build went with its frame
+        self.header_rows = {}
+        self._add_header_row()
+
+    def _collect_post_fields(self, cfg):
+        """Add the POST request fields to cfg."""
+        cfg["post_url"] = self.post_url_entry.get()
+        cfg["post_headers"] = self._collect_headers()
+        cfg["post_body"] = self.post_body_text.get("1.0", "end-1c")
+
+    def _build_shell_fields(self, frame):
+        """Fields for shell command buttons."""
+        self._type_save_handlers["shell"] = self._collect_shell_fields
+        self.shell_var = tk.StringVar(value=self.btn_cfg.get("shell_cmd", ""))
+        self._add_row(frame, self._t("Shell Command:"), self.shell_var)
+
+    def _collect_shell_fields(self, cfg):
+        """Add the shell command fields to cfg."""
+        cfg["shell_cmd"] = self.shell_var.get()
+
+    def _build_timer_fields(self, frame):
+        """Fields for timer buttons."""
+        self._type_save_handlers["timer"] = self._collect_timer_fields
+        self.timer_duration_var = tk.StringVar(value=self.btn_cfg.get("timer_duration", "0:01:00"))
+        self._add_row(frame, self._t("Timer Duration (h:mm:ss):"), self.timer_duration_var)
+
+    def _collect_timer_fields(self, cfg):
+        """Add the timer fields to cfg."""
+        cfg["timer_duration"] = self.timer_duration_var.get()
+
+    def _build_llm_fields(self, frame):
+        """Fields for LLM chat buttons."""
+        self._type_save_handlers["llm"] = self._collect_llm_fields
+        cfg = self.btn_cfg
+        # Add LLM specific fields
+        tk.Label(frame, text=self._t("LLM Provider:")).pack(anchor="w", padx=10, pady=(10,0))
+        self.llm_provider_var = tk.StringVar(value=cfg.get("llm_provider", "openai"))
+        provider_menu = self._build_choice_menu(frame, self.llm_provider_var, _LLM_PROVIDERS,
+                                                command=self._on_llm_provider_change)
+        provider_menu.config(**self._menu_kw)
+        provider_menu.pack(padx=10, fill=tk.X, pady=(0,6))
+        
+        # Endpoint URL field (for Azure)
+        self.endpoint_var = tk.StringVar(value=cfg.get("llm_endpoint", ""))
+        self.endpoint_entry = self._add_row(frame, self._t("Endpoint URL:"), self.endpoint_var, pady=(6,0))
+        
+        self.api_key_var = tk.StringVar(value=cfg.get("llm_api_key", ""))
+        self._add_row(frame, self._t("API Key:"), self.api_key_var, show="*", pady=(6,0))
+        
+        
+        
+        # Model field - textbox for Azure, dropdown for others
+        self.model_var = tk.StringVar(value=cfg.get("llm_model", "gpt-3.5-turbo"))
+        self.model_entry = self._add_row(frame, self._t("Model:"), self.model_var, pady=(6,0))
+        
+        # Model dropdowns for non-Azure providers, one per provider
+        self._model_dropdowns = {}
+        
+        tk.Label(frame, text=self._t("Context (system prompt):")).pack(anchor="w", padx=10, pady=(6,0))
+        self.context_text = tk.Text(frame, height=3, width=30)
+        llm_context = cfg.get("llm_context", "")
+        if llm_context:
+            self.context_text.insert("1.0", llm_context)
+        self.context_text.pack(padx=10, fill=tk.X, expand=True)
+        
+        # MCP/Proxy settings
+        tk.Label(frame, text=self._t("MCP/Proxy Settings:"), font=("Segoe UI", 10, "bold")).pack(anchor="w", padx=10, pady=(10,0))
+        
+        # MCP proxies frame
+        self.mcp_frame = tk.Frame(frame)
+        self.mcp_frame.pack(fill=tk.X, padx=10, pady=(5,0))
+        
+        # Initialize MCP proxies list
+        self.mcp_proxies = cfg.get("llm_proxies", [""])
+        self.mcp_entries = {}
+        self._mcp_entry_pool = []
+        
+        # Add initial proxy entry
+        self._add_mcp_proxy_entry()
+        
+        # Add new proxy button
+        add_proxy_btn = tk.Button(frame, text="➕ " + self._t("Add New Proxy"), 
+                                command=self._add_mcp_proxy_entry, **self._btn_kw)
+        add_proxy_btn.pack(padx=10, pady=(5,0), anchor="w")
+        
+        # Initialize provider-specific UI
+        self._on_llm_provider_change()
+
+    def _collect_llm_fields(self, cfg):
+        """Add the LLM chat fields to cfg."""
+        cfg["llm_provider"] = self.llm_provider_var.get()
+        cfg["llm_endpoint"] = self.endpoint_var.get()
+        cfg["llm_api_key"] = self.api_key_var.get()
+        cfg["llm_model"] = self.model_var.get()
+        cfg["llm_context"] = self.context_text.get("1.0", "end-1c")
+        cfg["llm_proxies"] = self._collect_mcp_proxies()
+
+    def _build_app_launcher_fields(self, frame):
+        """Fields for application launcher buttons."""
+        self._type_save_handlers["app_launcher"] = self._collect_app_launcher_fields
+        cfg = self.btn_cfg
+        tk.Label(frame, text=self._t("Application Path:")).pack(anchor="w", padx=10, pady=(10,0))
+        app_path_frame = tk.Frame(frame)
+        app_path_frame.pack(padx=10, fill=tk.X, expand=True)
+        self.app_path_var = tk.StringVar(value=cfg.get("app_path", ""))
+        app_path_entry = tk.Entry(app_path_frame, textvariable=self.app_path_var)
+        app_path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        browse_app_btn = tk.Button(app_path_frame, text=self._t("Browse..."), command=self.browse_app, **self._btn_kw)
+        browse_app_btn.pack(side=tk.LEFT, padx=(4,0))
+        
+        self.app_args_var = tk.StringVar(value=cfg.get("args", ""))
+        self._add_row(frame, self._t("Arguments (optional):"), self.app_args_var)
+        
+        # Background option
+        self.app_background_var = tk.BooleanVar(value=cfg.get("background", False))
+        app_background_check = tk.Checkbutton(frame, text=self._t("Run in background"), 
+                                            variable=self.app_background_var, **self._check_kw)
+        app_background_check.pack(anchor="w", padx=10, pady=(5,0))
+
+    def _collect_app_launcher_fields(self, cfg):
+        """Add the application launcher fields to cfg."""
+        cfg["app_path"] = self.app_path_var.get()
+        cfg["args"] = self.app_args_var.get()
+        cfg["background"] = self.app_background_var.get()
+
+    def _build_network_speed_fields(self, frame):
+        """Fields for network speed test buttons."""
+        # Network speed test configuration
+        info_label = tk.Label(frame, text=self._t("Click the button to run a network speed test. Results will be displayed on the button."), wraplength=300, justify="left")
+        info_label.pack(anchor="w", padx=10, pady=(10,0))
+
+    def _build_ping_fields(self, frame):
+        """Fields for ping buttons."""
+        self._type_save_handlers["ping"] = self._collect_ping_fields
+        cfg = self.btn_cfg
+        # Ping configuration
+        info_label = tk.Label(frame, text=self._t("Click the button to ping a host. Results will be displayed on the button."), wraplength=300, justify="left")
+        info_label.pack(anchor="w", padx=10, pady=(10,0))
+        
+        # Host configuration
+        self.ping_host_var = tk.StringVar(value=cfg.get("ping_host", "8.8.8.8"))
+        self._add_row(frame, self._t("Host to ping:"), self.ping_host_var)
+        
+        # Ping count configuration
+        self.ping_count_var = tk.StringVar(value=str(cfg.get("ping_count", 3)))
+        self._add_row(frame, self._t("Number of pings:"), self.ping_count_var)
+        
+        # Help text
+        help_label = tk.Label(frame, text=self._t("Enter hostname or IP address (e.g., google.com, 8.8.8.8)"), wraplength=300, justify="left", font=("Segoe UI", 8))
+        help_label.pack(anchor="w", padx=10, pady=(5,0))
+
+    def _collect_ping_fields(self, cfg):
+        """Add the ping fields to cfg."""
+        cfg["ping_host"] = self.ping_host_var.get()
+        cfg["ping_count"] = self._int_or(self.ping_count_var, 3)
+
+    def _build_pomodoro_fields(self, frame):
+        """Fields for Pomodoro timer buttons."""
+        self._type_save_handlers["pomodoro"] = self._collect_pomodoro_fields
+        cfg = self.btn_cfg
+        # Pomodoro configuration
+        info_label = tk.Label(frame, text=self._t("Click to start Pomodoro timer. Click: start/pause, Right-click: skip, Double-click: reset"), wraplength=300, justify="left")
+        info_label.pack(anchor="w", padx=10, pady=(10,0))
+        
+        # Work duration
+        self.work_duration_var = tk.StringVar(value=str(cfg.get("work_duration", 25)))
+        self._add_row(frame, self._t("Work Duration (minutes):"), self.work_duration_var)
+        
+        # Short break duration
+        self.short_break_var = tk.StringVar(value=str(cfg.get("short_break_duration", 5)))
+        self._add_row(frame, self._t("Short Break (minutes):"), self.short_break_var)
+        
+        # Long break duration
+        self.long_break_var = tk.StringVar(value=str(cfg.get("long_break_duration", 15)))
+        self._add_row(frame, self._t("Long Break (minutes):"), self.long_break_var)
+        
+        # Sessions before long break
+        self.sessions_var = tk.StringVar(value=str(cfg.get("sessions_before_long_break", 4)))
+        self._add_row(frame, self._t("Sessions before Long Break:"), self.sessions_var)
+        
+        # Auto-advance option
+        self.auto_advance_var = tk.BooleanVar(value=cfg.get("auto_advance", True))
+        auto_advance_check = tk.Checkbutton(frame, text=self._t("Auto-advance between phases"), 
+                                          variable=self.auto_advance_var, **self._check_kw)
+        auto_advance_check.pack(anchor="w", padx=10, pady=(5,0))
+
+    def _collect_pomodoro_fields(self, cfg):
+        """Add the Pomodoro timer fields to cfg."""
+        cfg["work_duration"] = self._int_or(self.work_duration_var, 25)
+        cfg["short_break_duration"] = self._int_or(self.short_break_var, 5)
+        cfg["long_break_duration"] = self._int_or(self.long_break_var, 15)
+        cfg["sessions_before_long_break"] = self._int_or(self.sessions_var, 4)
+        cfg["auto_advance"] = self.auto_advance_var.get()
+
+    def _build_http_test_fields(self, frame):
+        """Fields for HTTP test buttons."""
+        self._type_save_handlers["http_test"] = self._collect_http_test_fields
+        cfg = self.btn_cfg
+        # HTTP test configuration
+        info_label = tk.Label(frame, text=self._t("Click to test HTTP/HTTPS connectivity. Shows lock status and response time."), wraplength=300, justify="left")
+        info_label.pack(anchor="w", padx=10, pady=(10,0))
+        
+        # Test URL
+        self.test_url_var = tk.StringVar(value=cfg.get("test_url", "https://google.com"))
+        self._add_row(frame, self._t("Test URL:"), self.test_url_var)
+        
+        # Timeout
+        self.timeout_var = tk.StringVar(value=str(cfg.get("timeout", 10)))
+        self._add_row(frame, self._t("Timeout (seconds):"), self.timeout_var)
+        
+        # Help text
+        help_label = tk.Label(frame, text=self._t("🔒 = HTTPS with valid certificate, 🔓 = HTTPS with invalid certificate, 🌐 = HTTP only"), wraplength=300, justify="left", font=("Segoe UI", 8))
+        help_label.pack(anchor="w", padx=10, pady=(5,0))
+
+    def _collect_http_test_fields(self, cfg):
+        """Add the HTTP test fields to cfg."""
+        cfg["test_url"] = self.test_url_var.get()
+        cfg["timeout"] = self._int_or(self.timeout_var, 10)
+
+    def _build_color_picker_fields(self, frame):
+        """Fields for color picker buttons."""
+        # Color picker configuration
+        info_label = tk.Label(frame, text=self._t("Click to pick a color from anywhere on your screen. The hex color code will be copied to clipboard."), wraplength=300, justify="left")
+        info_label.pack(anchor="w", padx=10, pady=(10,0))
+        
+        # Instructions
+        instructions_label = tk.Label(frame, text=self._t("Workflow: Click button → Click on screen → Color copied to clipboard"), wraplength=300, justify="left", font=("Segoe UI", 8))
+        instructions_label.pack(anchor="w", padx=10, pady=(5,0))
 
     def save(self):
         """Save the button configuration and close the dialog."""
+        t = self.type_var.get()
+        cfg = self._collect_cfg(t)
+        
+        # Nothing edited: close like Escape does, without rewriting the config and grid
+        btn_cfg = self.btn_cfg
+        if btn_cfg and all(k in btn_cfg and btn_cfg[k] == v for k, v in cfg.items()):
+            self.destroy()
+            return
+        
         # Check if this is a Python script button and Python executable is not configured
-        if self.type_var.get() == "python_script":
+        if t == "python_script":
             python_executable = self.master.config_data.get("python_executable", "")
             if not python_executable:
                 # Prompt user to configure Python executable
                 result = messagebox.askyesno(
-                    self.master._("Python Executable Required"),
-                    self.master._("No Python executable is configured. Would you like to configure it now?")
+                    self._t("Python Executable Required"),
+                    self._t("No Python executable is configured. Would you like to configure it now?")
                 )
                 if result:
                     # Open settings dialog to configure Python executable
@@ -1013,94 +1213,43 @@ class ButtonSettingsDialog(tk.Toplevel):
                         self.master, 
                         self.theme, 
                         self.master.config_data, 
-                        lambda new_settings: self._on_settings_save(new_settings)
+                        self._on_settings_save
                     )
                     return  # Don't save yet, wait for settings to be saved
                 else:
                     # User cancelled, don't save the button
                     return
         
-        cfg = {
-            "type": self.type_var.get(),
-            "label": self.label_var.get(),
-            "tooltip": self.tooltip_var.get(),
-            "shortcut": self.shortcut_var.get(),
-            "args": self.args_var.get(),
-            "script": self.script_var.get(),
-            "url": self.url_var.get(),
-            "music": self.music_var.get(),
-            "icon": self.icon_var.get(),
-            "bg_color": self.bg_color,
-            "fg_color": self.fg_color,
-            "use_default_colors": self.use_default_colors_var.get(),
-            "use_default_animation": self.use_default_animation_var.get(),
-            "animation_type": self.animation_display_to_code.get(self.animation_type_var.get(), "ripple"),
-            "disable_animation": self.disable_animation_var.get(),
-        }
-        
-        # Add type-specific fields
-        if self.type_var.get() == "python_script" and hasattr(self, 'background_var'):
-            cfg["background"] = self.background_var.get()
-        elif self.type_var.get() == "post":
-            cfg["post_url"] = self.post_url_entry.get() if hasattr(self, "post_url_entry") else ""
-            cfg["post_headers"] = self._collect_headers()
-            cfg["post_body"] = self.post_body_text.get("1.0", tk.END).strip() if hasattr(self, "post_body_text") else ""
-        elif self.type_var.get() == "shell" and hasattr(self, 'shell_var'):
-            cfg["shell_cmd"] = self.shell_var.get()
-        elif self.type_var.get() == "timer" and hasattr(self, 'timer_duration_var'):
-            cfg["timer_duration"] = self.timer_duration_var.get()
-        elif self.type_var.get() == "llm":
-            cfg["llm_provider"] = self.llm_provider_var.get() if hasattr(self, 'llm_provider_var') else ""
-            cfg["llm_endpoint"] = self.endpoint_var.get() if hasattr(self, 'endpoint_var') else ""
-            cfg["llm_api_key"] = self.api_key_var.get() if hasattr(self, 'api_key_var') else ""
-            cfg["llm_model"] = self.model_var.get() if hasattr(self, 'model_var') else ""
-            cfg["llm_context"] = self.context_text.get("1.0", tk.END).strip() if hasattr(self, 'context_text') else ""
-            cfg["llm_proxies"] = self._collect_mcp_proxies() if hasattr(self, 'mcp_entries') else []
-        elif self.type_var.get() == "app_launcher":
-            cfg["app_path"] = self.app_path_var.get() if hasattr(self, 'app_path_var') else ""
-            cfg["args"] = self.app_args_var.get() if hasattr(self, 'app_args_var') else ""
-            cfg["background"] = self.app_background_var.get() if hasattr(self, 'app_background_var') else False
-
-        elif self.type_var.get() == "ping":
-            cfg["ping_host"] = self.ping_host_var.get() if hasattr(self, 'ping_host_var') else "8.8.8.8"
-            try:
-                cfg["ping_count"] = int(self.ping_count_var.get()) if hasattr(self, 'ping_count_var') else 3
-            except ValueError:
-                cfg["ping_count"] = 3
-        elif self.type_var.get() == "pomodoro":
-            try:
-                cfg["work_duration"] = int(self.work_duration_var.get()) if hasattr(self, 'work_duration_var') else 25
-            except ValueError:
-                cfg["work_duration"] = 25
-            try:
-                cfg["short_break_duration"] = int(self.short_break_var.get()) if hasattr(self, 'short_break_var') else 5
-            except ValueError:
-                cfg["short_break_duration"] = 5
-            try:
-                cfg["long_break_duration"] = int(self.long_break_var.get()) if hasattr(self, 'long_break_var') else 15
-            except ValueError:
-                cfg["long_break_duration"] = 15
-            try:
-                cfg["sessions_before_long_break"] = int(self.sessions_var.get()) if hasattr(self, 'sessions_var') else 4
-            except ValueError:
-                cfg["sessions_before_long_break"] = 4
-            cfg["auto_advance"] = self.auto_advance_var.get() if hasattr(self, 'auto_advance_var') else True
-        elif self.type_var.get() == "http_test":
-            cfg["test_url"] = self.test_url_var.get() if hasattr(self, 'test_url_var') else "https://google.com"
-            try:
-                cfg["timeout"] = int(self.timeout_var.get()) if hasattr(self, 'timeout_var') else 10
-            except ValueError:
-                cfg["timeout"] = 10
-        
         if self.on_save:
             self.on_save(cfg)
         self.destroy()
 
+    def _collect_cfg(self, t):
+        """Build the button config of type ``t`` from the dialog's fields."""
+        # Read all base variables in a single Tcl round trip instead of one get() each
+        fields = _BASE_STR_FIELDS + _BASE_BOOL_FIELDS
+        values = self.tk.splitlist(self.tk.eval(
+            "list " + " ".join("${%s}" % getattr(self, attr) for _, attr in fields)))
+        cfg = {"type": t}
+        cfg.update(zip((key for key, _ in _BASE_STR_FIELDS), values))
+        getboolean = self.tk.getboolean
+        for (key, _), value in zip(_BASE_BOOL_FIELDS, values[len(_BASE_STR_FIELDS):]):
+            cfg[key] = getboolean(value)
+        cfg["bg_color"] = self.bg_color
+        cfg["fg_color"] = self.fg_color
+        cfg["animation_type"] = self._animation_code
+        
+        # Add type-specific fields; a handler is registered when the type's fields are built
+        save_handler = self._type_save_handlers.get(t)
+        if save_handler:
+            save_handler(cfg)
+        return cfg
+
     def _on_settings_save(self, new_settings):
         """Handle settings save and then save the button."""
         # Update the master's config data
         self.master.config_data.update(new_settings)
-        self.master.save_config()
+        self.master.settings_manager.schedule_save()
         
         # Now save the button
         self.save()
@@ -1113,59 +1262,32 @@ class ButtonSettingsDialog(tk.Toplevel):
 
     def duplicate(self):
         """Duplicate this button and add it as a new button."""
-        cfg = {
-            "type": self.type_var.get(),
-            "label": self.label_var.get() + " (Copy)",
-            "tooltip": self.tooltip_var.get(),
-            "shortcut": "",  # Clear shortcut for duplicate
-            "args": self.args_var.get(),
-            "script": self.script_var.get(),
-            "url": self.url_var.get(),
-            "music": self.music_var.get(),
-            "icon": self.icon_var.get(),
-            "bg_color": self.bg_color,
-            "fg_color": self.fg_color,
-            "use_default_colors": self.use_default_colors_var.get(),
-            "use_default_animation": self.use_default_animation_var.get(),
-            "animation_type": self.animation_display_to_code.get(self.animation_type_var.get(), "ripple"),
-            "disable_animation": self.disable_animation_var.get(),
-        }
-        
-        # Add type-specific fields
-        if self.type_var.get() == "python_script" and hasattr(self, 'background_var'):
-            cfg["background"] = self.background_var.get()
-        elif self.type_var.get() == "post":
-            cfg["post_url"] = self.post_url_entry.get() if hasattr(self, "post_url_entry") else ""
-            cfg["post_headers"] = self._collect_headers()
-            cfg["post_body"] = self.post_body_text.get("1.0", tk.END).strip() if hasattr(self, "post_body_text") else ""
-        elif self.type_var.get() == "shell" and hasattr(self, 'shell_var'):
-            cfg["shell_cmd"] = self.shell_var.get()
-        elif self.type_var.get() == "timer" and hasattr(self, 'timer_duration_var'):
-            cfg["timer_duration"] = self.timer_duration_var.get()
-        elif self.type_var.get() == "llm":
-            cfg["llm_provider"] = self.llm_provider_var.get() if hasattr(self, 'llm_provider_var') else ""
-            cfg["llm_endpoint"] = self.endpoint_var.get() if hasattr(self, 'endpoint_var') else ""
-            cfg["llm_api_key"] = self.api_key_var.get() if hasattr(self, 'api_key_var') else ""
-            cfg["llm_model"] = self.model_var.get() if hasattr(self, 'model_var') else ""
-            cfg["llm_context"] = self.context_text.get("1.0", tk.END).strip() if hasattr(self, 'context_text') else ""
-            cfg["llm_proxies"] = self._collect_mcp_proxies() if hasattr(self, 'mcp_entries') else []
+        cfg = self._collect_cfg(self.type_var.get())
+        cfg["label"] += " (Copy)"
+        cfg["shortcut"] = ""  # Clear shortcut for duplicate
         
         self.master.config_data.setdefault("buttons", []).append(cfg)
-        self.master.save_config()
+        self.master.settings_manager.schedule_save()
         self.master.refresh_grid()
         self.destroy()
 
+    def destroy(self):
+        """Drop the cached per-type frames and close the dialog."""
+        if self._warm_id is not None:
+            self.after_cancel(self._warm_id)
+            self._warm_id = None
+        self._type_frames = {}
+        self._shown_type_frame = None
+        self._shown_type = None
+        super().destroy()
+
     def apply_theme(self, theme):
         apply_theme_recursive(self, theme)
         
-        # Update scrollbar colors
-        if hasattr(self, 'scrollbar') and self.scrollbar.winfo_exists():
-            self.scrollbar.configure(
-                bg=theme.get("scrollbar_bg", "#c0c0c0"),
-                troughcolor=theme.get("scrollbar_trough", "#f0f0f0"),
-                activebackground=theme.get("scrollbar_bg", "#c0c0c0"),
-                relief=tk.FLAT, borderwidth=0
-            )
-        
-        if hasattr(self, '_updating_fields') and not self._updating_fields:
-            self.update_fields()  # To redraw dynamic fields with new theme 
\ No newline at end of file
+        # Update scrollbar colors; the scrollbar lives exactly as long as the dialog
+        self.scrollbar.configure(
+            bg=theme.get("scrollbar_bg", "#c0c0c0"),
+            troughcolor=theme.get("scrollbar_trough", "#f0f0f0"),
+            activebackground=theme.get("scrollbar_bg", "#c0c0c0"),
+            relief=tk.FLAT, borderwidth=0
+        ) 
\ No newline at end of file
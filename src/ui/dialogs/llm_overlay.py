@@ -4,7 +4,7 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 import datetime
 import re
-import textwrap
+import threading
 
 from src.ui.components.tooltip import Tooltip
 from src.ui.themes import apply_theme_recursive
@@ -21,6 +21,10 @@ try:
 except ImportError:
     genai = None
 
+# genai.configure() sets a process-wide key, so configuring it and binding a new
+# model to it must not interleave between chat windows using different keys
+_genai_lock = threading.Lock()
+
 
 class LLMChatOverlay(tk.Toplevel):
     """A floating window for LLM chat (OpenAI, Azure, Gemini, etc)."""
@@ -48,6 +52,9 @@ class LLMChatOverlay(tk.Toplevel):
         # Chat data
         self.conversation = []
         self.first_message_time = None
+        self._llm_pending = False  # A request is running on a worker thread
+        # API clients/sessions reused across messages, keyed by provider and credentials
+        self._llm_clients = {}
         
         # Colors for chat bubbles (will be set by theme)
         self.user_bubble_color = None
@@ -68,15 +75,9 @@ class LLMChatOverlay(tk.Toplevel):
         # Force theme reapplication after a short delay
         self.after(50, lambda: self.apply_theme(master.theme))
         
-        # Initialize chat width after window is fully created
-        # self.after(100, self._update_chat_width)  # Disabled to prevent width shrinking
-        
         # Apply theme after window is fully created
         self.after(100, lambda: self.apply_theme(master.theme))
         
-        # Set initial canvas width to prevent messages from being too wide
-        self.after(300, self._set_initial_width)
-        
         # Ensure send button is always visible
         self.after(200, self._ensure_send_button_visible)
         
@@ -110,40 +111,47 @@ class LLMChatOverlay(tk.Toplevel):
         Tooltip(export_btn, self.master._("Export chat to file"))
 
     def create_chat_area(self):
-        """Create the scrollable chat area with canvas."""
+        """Create the chat log: a single read-only Text widget, one tagged block per message."""
+        chat_bg = self.master.theme.get("chat_bg", "#FFFFFF")
         # Main chat container with no side padding for maximum width
-        self.chat_container = tk.Frame(self, bg=self.master.theme.get("chat_bg", "#FFFFFF"))
+        self.chat_container = tk.Frame(self, bg=chat_bg)
         self.chat_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=2)
         
-        # Canvas and scrollbar for chat
-        self.chat_canvas = tk.Canvas(self.chat_container, bg=self.master.theme.get("chat_bg", "#FFFFFF"), 
-                                   highlightthickness=0, borderwidth=0)
+        # Messages are runs of tagged text instead of widgets of their own, so
+        # a long chat costs no extra widgets, layout or redraw passes
+        self.chat_log = tk.Text(self.chat_container, wrap=tk.WORD, state=tk.DISABLED, bg=chat_bg,
+                                font=("Segoe UI", 10), relief=tk.FLAT, borderwidth=0, highlightthickness=0,
+                                padx=0, pady=4, cursor="arrow", insertwidth=0,
+                                selectbackground=self.master.theme.get("chat_text_select_bg", "#005a9e"),
+                                selectforeground=self.master.theme.get("chat_text_select_fg", "#ffffff"))
         self.chat_scrollbar = tk.Scrollbar(self.chat_container, orient=tk.VERTICAL, 
-                                         command=self.chat_canvas.yview, width=20,
+                                         command=self.chat_log.yview, width=20,
                                          bg=self.master.theme.get("scrollbar_bg", "#c0c0c0"),
                                          troughcolor=self.master.theme.get("scrollbar_trough", "#f0f0f0"),
                                          activebackground=self.master.theme.get("scrollbar_bg", "#c0c0c0"),
                                          highlightthickness=0, relief=tk.FLAT, borderwidth=0)
-        self.chat_frame = tk.Frame(self.chat_canvas, bg=self.master.theme.get("chat_bg", "#FFFFFF"))
+        self.chat_log.configure(yscrollcommand=self.chat_scrollbar.set)
         
-        # Configure canvas
-        self.chat_canvas.configure(yscrollcommand=self.chat_scrollbar.set)
-        self.chat_window = self.chat_canvas.create_window((0, 0), window=self.chat_frame, anchor="nw")
-        
-        # Pack canvas and scrollbar - ensure scrollbar is always visible
-        self.chat_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 2))
+        # Pack log and scrollbar - ensure scrollbar is always visible
+        self.chat_log.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 2))
         self.chat_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Force scrollbar to be always visible
-        self.chat_scrollbar.pack_propagate(False)
-        
-        # Bind events
-        self.chat_frame.bind("<Configure>", self._on_chat_frame_configure)
-        self.chat_canvas.bind("<Configure>", self._on_chat_canvas_configure)
-        self.chat_canvas.bind("<MouseWheel>", self._on_mousewheel)
-        
-        # Bind window resize events for better width adjustment
-        self.bind("<Configure>", self._on_window_resize)
+        # Layout of the message parts; colours are set by apply_theme.
+        # User messages are right-aligned, assistant messages left-aligned
+        for role, justify, lmargin, rmargin in (("user", tk.RIGHT, 40, 8), ("assistant", tk.LEFT, 8, 40)):
+            self.chat_log.tag_configure(f"{role}_name", justify=justify, lmargin1=lmargin, lmargin2=lmargin,
+                                        rmargin=rmargin, font=("Segoe UI", 9, "bold"), spacing1=6)
+            self.chat_log.tag_configure(f"{role}_bubble", justify=justify, lmargin1=lmargin, lmargin2=lmargin,
+                                        rmargin=rmargin, spacing1=2, spacing2=1, spacing3=2)
+            self.chat_log.tag_configure(f"{role}_time", justify=justify, lmargin1=lmargin, lmargin2=lmargin,
+                                        rmargin=rmargin, font=("Segoe UI", 8), spacing3=4)
+        
+        # The log is disabled, which keeps it read-only but still selectable;
+        # it only takes focus (for Ctrl+C) when clicked
+        self.chat_log.bind("<Button-1>", lambda e: self.chat_log.focus_set())
+        self.chat_log.bind("<Button-3>", self._show_chat_context_menu)
+        self.chat_log.bind("<Control-c>", self._copy_chat)
+        self.chat_log.bind("<Control-C>", self._copy_chat)
 
     def create_input_area(self):
         """Create the input area with auto-resizing text widget."""
@@ -186,88 +194,6 @@ class LLMChatOverlay(tk.Toplevel):
         # Focus on input
         self.input_text.focus_set()
 
-    def _on_chat_frame_configure(self, event=None):
-        """Update canvas scrollregion when frame size changes."""
-        self.chat_canvas.configure(scrollregion=self.chat_canvas.bbox("all"))
-
-    def _on_chat_canvas_configure(self, event=None):
-        """Update frame width when canvas is resized."""
-        try:
-            # Get the canvas width
-            canvas_width = self.chat_canvas.winfo_width()
-            
-            # Ensure minimum width
-            if canvas_width < 200:
-                canvas_width = 200
-            
-            # Account for scrollbar width and padding
-            scrollbar_width = self.chat_scrollbar.winfo_width() if self.chat_scrollbar.winfo_exists() else 20
-            padding = 8  # Extra padding to prevent overlap
-            
-            # Calculate available width for chat content
-            available_width = canvas_width - scrollbar_width - padding
-            
-            # Ensure minimum available width
-            if available_width < 150:
-                available_width = 150
-            
-            # Update the chat frame width to use the available space
-            self.chat_canvas.itemconfig(self.chat_window, width=available_width)
-            
-        except Exception as e:
-            logger.error(f"Error in canvas configure: {e}")
-
-    def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling."""
-        self.chat_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-    def _on_window_resize(self, event=None):
-        """Handle window resize events to adjust chat area width."""
-        # Handle window resize events - disabled automatic width updates to prevent shrinking
-        pass
-
-
-
-    def _redraw_messages(self):
-        """Redraw existing messages to adjust to new width."""
-        try:
-            # Get the current theme background color
-            chat_bg = self.master.theme.get("chat_bg", "#FFFFFF")
-            
-            # Force existing text widgets to recalculate their wrapping and remove borders
-            for widget in self.chat_frame.winfo_children():
-                if isinstance(widget, tk.Frame):  # Message container
-                    # Remove any borders from message container and ensure correct background
-                    widget.configure(relief=tk.FLAT, borderwidth=0, highlightthickness=0, bg=chat_bg)
-                    for child in widget.winfo_children():
-                        if isinstance(child, tk.Frame):  # Message frame or bubble frame
-                            # Remove any borders from frame and ensure correct background
-                            child.configure(relief=tk.FLAT, borderwidth=0, 
-                                          highlightthickness=0, highlightbackground=child.cget("bg"),
-                                          highlightcolor=child.cget("bg"), bg=chat_bg)
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, tk.Text):
-                                    # Temporarily enable to recalculate
-                                    grandchild.config(state=tk.NORMAL)
-                                    content = grandchild.get("1.0", tk.END + "-1c")
-                                    grandchild.delete("1.0", tk.END)
-                                    grandchild.insert("1.0", content)
-                                    self._resize_text_widget(grandchild)
-                                    # Remove any borders from text widget and update selection colors
-                                    grandchild.config(state=tk.NORMAL, relief=tk.FLAT, borderwidth=0,
-                                                     highlightthickness=0, 
-                                                     selectbackground=self.master.theme.get("chat_text_select_bg", "#005a9e"),
-                                                     selectforeground=self.master.theme.get("chat_text_select_fg", "#ffffff"), 
-                                                     insertwidth=0)
-                                elif isinstance(grandchild, tk.Label):  # Name or time labels
-                                    # Remove any borders from labels and ensure correct background
-                                    grandchild.configure(relief=tk.FLAT, borderwidth=0, highlightthickness=0, bg=chat_bg)
-                        elif isinstance(child, tk.Label):  # Name or time labels
-                            # Remove any borders from labels and ensure correct background
-                            child.configure(relief=tk.FLAT, borderwidth=0, highlightthickness=0, bg=chat_bg)
-        except Exception as e:
-            logger.error(f"Error redrawing messages: {e}")
-
     def _on_input_keypress(self, event):
         """Handle input keypress for auto-resize."""
         # Schedule resize check
@@ -323,6 +249,8 @@ class LLMChatOverlay(tk.Toplevel):
 
     def send_message(self, event=None):
         """Send a message."""
+        if self._llm_pending:
+            return
         user_msg = self.input_text.get("1.0", tk.END + "-1c").strip()
         if not user_msg or user_msg == self.placeholder_text:
             return
@@ -346,153 +274,54 @@ class LLMChatOverlay(tk.Toplevel):
         self.append_message(self.master._("You"), user_msg, timestamp)
         
         # Get AI response
-        self.after(100, lambda: self.get_llm_response(user_msg))
+        self.get_llm_response(user_msg)
 
     def append_message(self, sender, message, timestamp=None):
-        """Add a message bubble to the chat."""
+        """Add a message (author, text, time) to the end of the chat log."""
         if timestamp is None:
             timestamp = datetime.datetime.now()
         
-        # Create message container with no side padding for maximum width
-        msg_container = tk.Frame(self.chat_frame, bg=self.master.theme.get("chat_bg", "#FFFFFF"), 
-                               relief=tk.FLAT, borderwidth=0, highlightthickness=0)
-        msg_container.pack(fill=tk.X, padx=0, pady=0, expand=True)
-        
-        # Ensure the message container background matches the theme
-        msg_container.configure(bg=self.master.theme.get("chat_bg", "#FFFFFF"))
-        
-        # Configure grid columns for proper expansion
-        msg_container.grid_columnconfigure(0, weight=1)
-        
-        # Determine alignment and colors
-        is_user = sender == self.master._("You")
-        if is_user:
-            bubble_color = self.user_bubble_color
-            text_color = self.user_text_color
-        else:
-            bubble_color = self.assistant_bubble_color
-            text_color = self.assistant_text_color
-        
-        # Create a frame to hold all message elements vertically aligned
-        message_frame = tk.Frame(msg_container, bg=self.master.theme.get("chat_bg", "#FFFFFF"),
-                               relief=tk.FLAT, borderwidth=0, highlightthickness=0)
-        # All messages span the full width, alignment is handled by the message content
-        if is_user:
-            message_frame.grid(row=0, column=0, sticky="ew", padx=(40, 8))
-        else:
-            message_frame.grid(row=0, column=0, sticky="ew", padx=(8, 40))
-        
-        # Ensure the message frame background matches the theme
-        message_frame.configure(bg=self.master.theme.get("chat_bg", "#FFFFFF"))
-        
-        # Author name (top)
-        name_label = tk.Label(message_frame, text=sender, bg=self.master.theme.get("chat_bg", "#FFFFFF"), 
-                            fg=self.name_color, font=("Segoe UI", 9, "bold"),
-                            relief=tk.FLAT, borderwidth=0, highlightthickness=0)
-        name_label.pack(anchor=tk.W if not is_user else tk.E, pady=(0, 0))
-        
-        # Create bubble frame with modern styling (no borders at all)
-        bubble_frame = tk.Frame(message_frame, bg=bubble_color, relief=tk.FLAT, borderwidth=0, 
-                               highlightthickness=0, highlightbackground=bubble_color,
-                               highlightcolor=bubble_color)
-        # Align bubble to left for assistant, right for user
-        if is_user:
-            bubble_frame.pack(anchor=tk.E, fill=tk.NONE, expand=False)
-        else:
-            bubble_frame.pack(anchor=tk.W, fill=tk.NONE, expand=False)
-        
-        # Message text (with markdown support)
-        formatted_message = self._format_markdown(message)
-        msg_text = tk.Text(bubble_frame, wrap=tk.WORD, bg=bubble_color, fg=text_color,
-                         font=("Segoe UI", 10), relief=tk.FLAT, padx=8, pady=4,
-                         height=1, cursor="ibeam", borderwidth=0,
-                         highlightthickness=0,                          selectbackground=self.master.theme.get("chat_text_select_bg", "#005a9e"),
-                         selectforeground=self.master.theme.get("chat_text_select_fg", "#ffffff"), insertwidth=0)
-        msg_text.pack(fill=tk.X, expand=True)
-        
-        # Insert formatted text
-        msg_text.insert("1.0", formatted_message)
-        
-        # Auto-resize text widget to content
-        self._resize_text_widget(msg_text)
-        
-        # Make text selectable but not editable by binding events
-        def prevent_edit(event):
-            return "break"
-        
-        # Bind events to prevent editing while allowing selection
-        msg_text.bind("<Key>", prevent_edit)
-        msg_text.bind("<Button-1>", lambda e: msg_text.focus_set())
-        
-        # Configure text widget to be read-only but selectable
-        msg_text.config(state=tk.NORMAL)
-        msg_text.bind("<KeyPress>", prevent_edit)
-        msg_text.bind("<KeyRelease>", prevent_edit)
-        
-        # Add right-click context menu for copy functionality
-        def show_context_menu(event):
-            try:
-                # Create context menu
-                context_menu = tk.Menu(self, tearoff=0)
-                context_menu.add_command(label=self.master._("Copy"), 
-                                       command=lambda: copy_selected_text())
-                context_menu.add_command(label=self.master._("Copy All"), 
-                                       command=lambda: copy_all_text())
-                context_menu.tk_popup(event.x_root, event.y_root)
-            except Exception as e:
-                logger.error(f"Error showing context menu: {e}")
-        
-        def copy_selected_text():
-            try:
-                selected_text = msg_text.get("sel.first", "sel.last")
-                if selected_text:
-                    self.clipboard_clear()
-                    self.clipboard_append(selected_text)
-            except tk.TclError:
-                # No text selected
-                pass
-        
-        def copy_all_text():
-            try:
-                all_text = msg_text.get("1.0", tk.END + "-1c")
-                if all_text:
-                    self.clipboard_clear()
-                    self.clipboard_append(all_text)
-            except Exception as e:
-                logger.error(f"Error copying all text: {e}")
-        
-        # Bind right-click to show context menu
-        msg_text.bind("<Button-3>", show_context_menu)
-        
-        # Add keyboard shortcuts for copying
-        def copy_on_ctrl_c(event):
-            try:
-                selected_text = msg_text.get("sel.first", "sel.last")
-                if selected_text:
-                    self.clipboard_clear()
-                    self.clipboard_append(selected_text)
-                return "break"  # Prevent default behavior
-            except tk.TclError:
-                # No text selected, copy all
-                all_text = msg_text.get("1.0", tk.END + "-1c")
-                if all_text:
-                    self.clipboard_clear()
-                    self.clipboard_append(all_text)
-                return "break"
-        
-        # Bind Ctrl+C to copy
-        msg_text.bind("<Control-c>", copy_on_ctrl_c)
-        msg_text.bind("<Control-C>", copy_on_ctrl_c)
-        
-        # Time label (bottom)
-        time_str = timestamp.strftime("%H:%M")
-        time_label = tk.Label(message_frame, text=time_str, bg=self.master.theme.get("chat_bg", "#FFFFFF"), 
-                            fg=self.time_color, font=("Segoe UI", 8),
-                            relief=tk.FLAT, borderwidth=0, highlightthickness=0)
-        time_label.pack(anchor=tk.W if not is_user else tk.E, pady=(0, 0))
+        role = "user" if sender == self.master._("You") else "assistant"
+        log = self.chat_log
+        log.configure(state=tk.NORMAL)
+        # One insert for all three parts, each with its own tag
+        log.insert(tk.END,
+                   sender + "\n", f"{role}_name",
+                   self._format_markdown(message) + "\n", f"{role}_bubble",
+                   timestamp.strftime("%H:%M") + "\n", f"{role}_time")
+        log.configure(state=tk.DISABLED)
         
         # Scroll to bottom
-        self.chat_canvas.after(10, self._scroll_to_bottom)
+        log.see(tk.END)
+
+    def _copy_chat(self, event=None):
+        """Copy the selected chat text, or the whole chat if nothing is selected."""
+        try:
+            text = self.chat_log.get("sel.first", "sel.last")
+        except tk.TclError:
+            # No text selected
+            text = self.chat_log.get("1.0", "end-1c")
+        if text:
+            self.clipboard_clear()
+            self.clipboard_append(text)
+        return "break"  # Prevent default behavior
+
+    def _copy_all_chat(self):
+        """Copy the whole chat log."""
+        text = self.chat_log.get("1.0", "end-1c")
+        if text:
+            self.clipboard_clear()
+            self.clipboard_append(text)
+
+    def _show_chat_context_menu(self, event):
+        """Show the Copy / Copy All menu for the chat log."""
+        try:
+            context_menu = tk.Menu(self, tearoff=0)
+            context_menu.add_command(label=self.master._("Copy"), command=self._copy_chat)
+            context_menu.add_command(label=self.master._("Copy All"), command=self._copy_all_chat)
+            context_menu.tk_popup(event.x_root, event.y_root)
+        except Exception as e:
+            logger.error(f"Error showing context menu: {e}")
 
     def _format_markdown(self, text):
         """Format markdown text for display."""
@@ -532,41 +361,17 @@ class LLMChatOverlay(tk.Toplevel):
         
         return text
 
-    def _resize_text_widget(self, text_widget):
-        """Resize text widget to fit content."""
-        try:
-            content = text_widget.get("1.0", tk.END + "-1c")
-            if not content.strip():
-                return
-            
-            # Calculate required height
-            lines = content.count('\n') + 1
-            # Get widget width to calculate wrapping
-            widget_width = text_widget.winfo_width()
-            if widget_width <= 1:  # Widget not yet rendered
-                widget_width = 400  # Default width for better initial sizing
-            
-            # Estimate wrapped lines with better character width calculation
-            # Account for padding (24px total) and use more accurate character width
-            available_width = widget_width - 24  # 12px padding on each side
-            avg_chars_per_line = max(1, available_width // 8)  # More accurate for Segoe UI
-            if avg_chars_per_line > 0:
-                wrapped_lines = len(textwrap.wrap(content, avg_chars_per_line))
-                lines = max(lines, wrapped_lines)
-            
-            # Set height (minimum 1, maximum 15 for better readability)
-            new_height = min(max(1, lines), 15)
-            text_widget.configure(height=new_height)
-            
-        except Exception as e:
-            logger.error(f"Error resizing text widget: {e}")
-
-    def _scroll_to_bottom(self):
-        """Scroll chat to bottom."""
-        self.chat_canvas.yview_moveto(1.0)
-
     def get_llm_response(self, user_msg):
-        """Get response from LLM using the button configuration."""
+        """Get response from LLM using the button configuration, without blocking the UI."""
+        # The API call can take seconds, so it runs on a worker thread and
+        # the result is handed back to the Tk thread with after()
+        self._llm_pending = True
+        self.send_btn.config(state=tk.DISABLED)
+        threading.Thread(target=self._fetch_llm_response, args=(user_msg,), daemon=True).start()
+
+    def _fetch_llm_response(self, user_msg):
+        """Call the configured LLM API (runs on a worker thread, must not touch widgets)."""
+        response = error_msg = None
         try:
             # Get configuration from button settings
             api_type = self.cfg.get("llm_provider", "openai")
@@ -577,24 +382,13 @@ class LLMChatOverlay(tk.Toplevel):
             # Validate required fields
             if not api_key:
                 error_msg = "API key is required. Please set up your API key in the button settings."
-                self._add_error_response(error_msg)
-                return
-            
-            if not model:
+            elif not model:
                 error_msg = "Model is required. Please select a model in the button settings."
-                self._add_error_response(error_msg)
-                return
-            
             # Validate Azure-specific requirements
-            if api_type == "azure":
-                endpoint = self.cfg.get("llm_endpoint", "")
-                if not endpoint:
-                    error_msg = "Endpoint URL is required for Azure. Please configure the endpoint URL in the button settings."
-                    self._add_error_response(error_msg)
-                    return
-            
+            elif api_type == "azure" and not self.cfg.get("llm_endpoint", ""):
+                error_msg = "Endpoint URL is required for Azure. Please configure the endpoint URL in the button settings."
             # Prepare the request
-            if api_type == "openai":
+            elif api_type == "openai":
                 response = self._call_openai_api(user_msg, api_key, model, context)
             elif api_type == "azure":
                 response = self._call_azure_api(user_msg, api_key, model, context)
@@ -602,26 +396,37 @@ class LLMChatOverlay(tk.Toplevel):
                 response = self._call_gemini_api(user_msg, api_key, model, context)
             else:
                 error_msg = f"Unsupported API type: {api_type}"
-                self._add_error_response(error_msg)
-                return
-            
-            if response:
-                # Add to conversation
-                timestamp = datetime.datetime.now()
-                self.conversation.append({
-                    "sender": self.master._("Assistant"),
-                    "message": response,
-                    "timestamp": timestamp
-                })
-                
-                # Display response
-                self.append_message(self.master._("Assistant"), response, timestamp)
-            else:
-                self._add_error_response("No response received from the API.")
-                
         except Exception as e:
             error_msg = f"Error calling LLM API: {str(e)}"
+        
+        try:
+            self.after(0, self._show_llm_response, response, error_msg)
+        except (RuntimeError, tk.TclError):
+            # The chat window was closed while the request was running
+            pass
+
+    def _show_llm_response(self, response, error_msg):
+        """Show the result of a finished LLM request in the chat."""
+        if not self.winfo_exists():
+            return
+        self._llm_pending = False
+        self.send_btn.config(state=tk.NORMAL)
+        
+        if error_msg:
             self._add_error_response(error_msg)
+        elif response:
+            # Add to conversation
+            timestamp = datetime.datetime.now()
+            self.conversation.append({
+                "sender": self.master._("Assistant"),
+                "message": response,
+                "timestamp": timestamp
+            })
+            
+            # Display response
+            self.append_message(self.master._("Assistant"), response, timestamp)
+        else:
+            self._add_error_response("No response received from the API.")
 
     def _add_error_response(self, error_msg):
         """Add an error message to the conversation."""
@@ -639,7 +444,10 @@ class LLMChatOverlay(tk.Toplevel):
             raise Exception("OpenAI library not installed. Install with: pip install openai")
         
         try:
-            client = openai.OpenAI(api_key=api_key)
+            key = ("openai", api_key)
+            client = self._llm_clients.get(key)
+            if client is None:
+                client = self._llm_clients[key] = openai.OpenAI(api_key=api_key)
             
             # Prepare messages
             messages = []
@@ -697,8 +505,11 @@ class LLMChatOverlay(tk.Toplevel):
                 "temperature": 0.7
             }
             
-            # Make request
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            # Make request; the session keeps the HTTPS connection alive between messages
+            session = self._llm_clients.get("azure")
+            if session is None:
+                session = self._llm_clients["azure"] = requests.Session()
+            response = session.post(url, headers=headers, json=data, timeout=30)
             
             if response.status_code != 200:
                 raise Exception(f"Azure API returned status {response.status_code}: {response.text}")
@@ -717,22 +528,28 @@ class LLMChatOverlay(tk.Toplevel):
             raise Exception("Google Generative AI library not installed. Install with: pip install google-generativeai")
         
         try:
-            # Configure API
-            genai.configure(api_key=api_key)
-            
             # Get model
             if not model or model == "default":
                 model = "gemini-pro"
             
-            model_instance = genai.GenerativeModel(model)
-            
             # Prepare prompt
             prompt = user_msg
             if context:
                 prompt = f"{context}\n\nUser: {user_msg}"
             
-            # Generate response
-            response = model_instance.generate_content(prompt)
+            key = ("gemini", api_key, model)
+            model_instance = self._llm_clients.get(key)
+            if model_instance is None:
+                # A new model takes the configured key with its first request, so
+                # configure and send that request before another window reconfigures
+                with _genai_lock:
+                    genai.configure(api_key=api_key)
+                    model_instance = genai.GenerativeModel(model)
+                    response = model_instance.generate_content(prompt)
+                self._llm_clients[key] = model_instance
+            else:
+                # Generate response
+                response = model_instance.generate_content(prompt)
             
             return response.text
             
@@ -772,6 +589,10 @@ class LLMChatOverlay(tk.Toplevel):
 
     def close(self):
         """Close the chat window."""
+        session = self._llm_clients.get("azure")
+        if session is not None:
+            session.close()
+        self._llm_clients.clear()
         self.destroy()
 
     def apply_theme(self, theme):
@@ -794,13 +615,7 @@ class LLMChatOverlay(tk.Toplevel):
         chat_bg = theme.get("chat_bg", "#FFFFFF")
         chat_input_bg = theme.get("chat_input_bg", "#F8F9FA")
         
-        # Force update all chat area backgrounds with multiple attempts
-        if hasattr(self, 'chat_frame'):
-            self.chat_frame.configure(bg=chat_bg)
-        if hasattr(self, 'chat_canvas'):
-            self.chat_canvas.configure(bg=chat_bg)
-            # Force canvas to redraw its background
-            self.chat_canvas.update_idletasks()
+        # Update chat area backgrounds
         if hasattr(self, 'chat_container'):
             self.chat_container.configure(bg=chat_bg)
         if hasattr(self, 'input_container'):
@@ -849,66 +664,22 @@ class LLMChatOverlay(tk.Toplevel):
         self.text_select_bg = theme.get("chat_text_select_bg", "#005a9e")
         self.text_select_fg = theme.get("chat_text_select_fg", "#ffffff")
         
-        # Force a redraw of existing messages to apply new theme colors
-        self.after(50, self._redraw_messages)
-        
-        # Force another theme application after a delay to ensure canvas background is set
-        self.after(100, lambda: self._force_canvas_background(chat_bg))
-        
         # Force topbar color update again after a delay
         self.after(150, lambda: self._force_topbar_color(theme["topbar_bg"]))
         
         apply_theme_recursive(self, theme)
+        
+        # Recolour the chat log after the generic walk; existing messages
+        # follow their tags, so nothing has to be redrawn
+        if hasattr(self, 'chat_log'):
+            self.chat_log.configure(bg=chat_bg, selectbackground=self.text_select_bg,
+                                    selectforeground=self.text_select_fg)
+            for role, bubble, text in (("user", self.user_bubble_color, self.user_text_color),
+                                       ("assistant", self.assistant_bubble_color, self.assistant_text_color)):
+                self.chat_log.tag_configure(f"{role}_name", foreground=self.name_color)
+                self.chat_log.tag_configure(f"{role}_bubble", background=bubble, foreground=text)
+                self.chat_log.tag_configure(f"{role}_time", foreground=self.time_color)
     
-    def _set_initial_width(self):
-        """Set the initial canvas width to prevent messages from being too wide."""
-        try:
-            if hasattr(self, 'chat_canvas') and self.chat_canvas.winfo_exists():
-                # Get the current window width
-                window_width = self.winfo_width()
-                if window_width <= 1:  # Window not yet fully rendered
-                    # Try again after a short delay
-                    self.after(100, self._set_initial_width)
-                    return
-                
-                # Calculate proper width accounting for scrollbar
-                scrollbar_width = self.chat_scrollbar.winfo_width() if self.chat_scrollbar.winfo_exists() else 20
-                padding = 12  # Extra padding to prevent overlap
-                
-                # Calculate available width for chat content
-                available_width = window_width - scrollbar_width - padding
-                
-                # Ensure minimum available width
-                if available_width < 150:
-                    available_width = 150
-                
-                # Update the chat frame width
-                if hasattr(self, 'chat_window'):
-                    self.chat_canvas.itemconfig(self.chat_window, width=available_width)
-                    
-                # Force a redraw to ensure the width is applied
-                self.chat_canvas.update_idletasks()
-                
-        except Exception as e:
-            logger.error(f"Error setting initial width: {e}")
-            # Try again after a short delay if there was an error
-            self.after(100, self._set_initial_width)
-
-    def _force_canvas_background(self, bg_color):
-        """Force the canvas background to be set properly."""
-        try:
-            if hasattr(self, 'chat_canvas') and self.chat_canvas.winfo_exists():
-                self.chat_canvas.configure(bg=bg_color)
-                # Force a complete redraw
-                self.chat_canvas.delete("all")
-                # Recreate the window
-                if hasattr(self, 'chat_window'):
-                    self.chat_window = self.chat_canvas.create_window((0, 0), window=self.chat_frame, anchor="nw")
-                # Force update
-                self.chat_canvas.update_idletasks()
-        except Exception as e:
-            logger.error(f"Error forcing canvas background: {e}")
-
     def _force_topbar_color(self, topbar_bg):
         """Force the topbar to use the exact same color as the main app."""
         try:
@@ -11,6 +11,8 @@ class TranslationManager:
     def __init__(self):
         self.translations = {}
         self.current_language = "en"
+        # Resolved texts keyed by (language, text); a language switch needs no invalidation
+        self._cache = {}
         self.load_translations()
     
     def load_translations(self):
@@ -18,10 +20,12 @@ class TranslationManager:
         try:
             with open(TRANSLATIONS_FILE, "r", encoding="utf-8") as f:
                 self.translations = json.load(f)
+            self._cache.clear()
         except Exception as e:
             logger.error(f"Failed to load translations: {e}")
             # Fallback to empty translations
             self.translations = {"en": {}, "nl": {}}
+            self._cache.clear()
     
     def set_language(self, language_code):
         """Set the current language."""
@@ -34,7 +38,12 @@ class TranslationManager:
     def get_text(self, text, language=None):
         """Get translated text for the current or specified language."""
         lang = language or self.current_language
-        return self.translations.get(lang, self.translations.get("en", {})).get(text, text)
+        key = (lang, text)
+        translated = self._cache.get(key)
+        if translated is None:
+            translated = self.translations.get(lang, self.translations.get("en", {})).get(text, text)
+            self._cache[key] = translated
+        return translated
     
     def _(self, text):
         """Shorthand method for getting translated text."""
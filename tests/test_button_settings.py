@@ -0,0 +1,29 @@
+"""Tests for the button settings dialog."""
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ui.dialogs.button_settings import ButtonSettingsDialog
+
+
+class TestIntOr(unittest.TestCase):
+    """Test cases for parsing integer fields."""
+
+    def test_valid_integer(self):
+        """Test that an integer string is parsed."""
+        self.assertEqual(ButtonSettingsDialog._int_or(Mock(get=Mock(return_value="7")), 3), 7)
+        self.assertEqual(ButtonSettingsDialog._int_or(Mock(get=Mock(return_value=" 12 ")), 3), 12)
+
+    def test_invalid_falls_back_to_default(self):
+        """Test that empty or non-integer input gives the default."""
+        for value in ("", "abc", "2.5"):
+            self.assertEqual(ButtonSettingsDialog._int_or(Mock(get=Mock(return_value=value)), 3), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,7 +63,7 @@ class TestSettingsManager(unittest.TestCase):
     
     def test_open_settings_dialog(self):
         """Test opening settings dialog."""
-        with patch('core.managers.settings_manager.SettingsDialog') as mock_dialog_class:
+        with patch('src.ui.dialogs.SettingsDialog') as mock_dialog_class:
             mock_dialog = MagicMock()
             mock_dialog_class.return_value = mock_dialog
             
@@ -86,7 +86,7 @@ class TestSettingsManager(unittest.TestCase):
     
     def test_open_about_dialog(self):
         """Test opening about dialog."""
-        with patch('core.managers.settings_manager.AboutDialog') as mock_dialog_class:
+        with patch('src.ui.dialogs.AboutDialog') as mock_dialog_class:
             mock_dialog = MagicMock()
             mock_dialog_class.return_value = mock_dialog
             
@@ -119,7 +119,8 @@ class TestSettingsManager(unittest.TestCase):
             'log_level': 'INFO'
         }
         
-        with patch.object(self.mock_app, 'save_config') as mock_save:
+        with patch.object(self.mock_app, 'save_config') as mock_save, \
+             patch.object(self.mock_app, 'after', return_value='after#1') as mock_after:
             self.settings_manager.save_settings(new_settings)
             
             # Check that config was updated
@@ -131,8 +132,14 @@ class TestSettingsManager(unittest.TestCase):
             self.assertEqual(self.mock_app.config_data['default_animation_type'], 'slide')
             self.assertEqual(self.mock_app.config_data['log_level'], 'INFO')
             
-            # Check that config was saved
+            # Check that the config write was scheduled, not done synchronously
+            mock_save.assert_not_called()
+            mock_after.assert_any_call(250, self.settings_manager._flush_save)
+            
+            # Check that the scheduled write saves the config once
+            self.settings_manager._flush_save()
             mock_save.assert_called_once()
+            self.assertIsNone(self.settings_manager._save_pending)
     
     def test_apply_settings(self):
         """Test applying settings."""
@@ -254,5 +261,105 @@ class TestSettingsManager(unittest.TestCase):
         self.assertIsNone(self.settings_manager.about_dialog)
 
 
+
+class TestSettingsManagerSave(unittest.TestCase):
+    """Test cases for debounced config writes and change detection in save_settings."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_app = MagicMock()
+        self.mock_app.after.side_effect = ['after#1', 'after#2', 'after#3']
+        self.mock_app.config_data = {
+            'theme': 'dark',
+            'language': 'en',
+            'translucency': 1.0,
+            'min_btn_width': 80,
+            'max_btn_width': 200,
+            'min_btn_height': 40,
+            'max_btn_height': 100,
+            'minimal_mode': False
+        }
+        self.settings_manager = SettingsManager(self.mock_app)
+    
+    def _settings(self, **changes):
+        """Return settings as the dialog would pass them, with some values changed."""
+        settings = {k: v for k, v in self.mock_app.config_data.items() if k != 'theme'}
+        settings.update(changes)
+        return settings
+    
+    def test_schedule_save_debounces(self):
+        """Test that rapid successive saves restart the timer and write once."""
+        self.settings_manager.schedule_save()
+        self.settings_manager.schedule_save()
+        
+        self.mock_app.after_cancel.assert_called_once_with('after#1')
+        self.assertEqual(self.settings_manager._save_pending, 'after#2')
+        self.mock_app.save_config.assert_not_called()
+        
+        self.settings_manager._flush_save()
+        self.mock_app.save_config.assert_called_once()
+        self.assertIsNone(self.settings_manager._save_pending)
+    
+    def test_cancel_pending_save(self):
+        """Test cancelling a scheduled write."""
+        self.settings_manager.schedule_save()
+        self.settings_manager.cancel_pending_save()
+        
+        self.mock_app.after_cancel.assert_called_once_with('after#1')
+        self.assertIsNone(self.settings_manager._save_pending)
+        
+        # Nothing pending, so nothing to cancel
+        self.settings_manager.cancel_pending_save()
+        self.mock_app.after_cancel.assert_called_once()
+        self.mock_app.save_config.assert_not_called()
+    
+    def test_save_settings_unchanged(self):
+        """Test that saving unchanged settings refreshes nothing."""
+        self.settings_manager.save_settings(self._settings())
+        
+        self.mock_app.after.assert_called_once_with(250, self.settings_manager._flush_save)
+        self.mock_app.attributes.assert_not_called()
+        self.mock_app.translation_manager.set_language.assert_not_called()
+        self.mock_app.update_theme.assert_not_called()
+        self.mock_app.button_manager.refresh_grid.assert_not_called()
+        self.mock_app.button_manager.relabel.assert_not_called()
+        self.mock_app.apply_minimal_mode.assert_not_called()
+    
+    def test_save_settings_translucency_change(self):
+        """Test that a translucency change only updates the window alpha."""
+        self.settings_manager.save_settings(self._settings(translucency=0.8))
+        
+        self.mock_app.attributes.assert_called_once_with('-alpha', 0.8)
+        self.mock_app.button_manager.refresh_grid.assert_not_called()
+        self.mock_app.button_manager.relabel.assert_not_called()
+    
+    def test_save_settings_language_change(self):
+        """Test that a language change relabels the buttons without rebuilding the grid."""
+        self.settings_manager.save_settings(self._settings(language='nl'))
+        
+        self.assertEqual(self.mock_app.config_data['language'], 'nl')
+        self.mock_app.translation_manager.set_language.assert_called_once_with('nl')
+        self.mock_app.update_topbar_tooltips.assert_called_once()
+        self.mock_app.button_manager.relabel.assert_called_once()
+        self.mock_app.button_manager.refresh_grid.assert_not_called()
+    
+    def test_save_settings_grid_change(self):
+        """Test that a button size change rebuilds the grid."""
+        self.settings_manager.save_settings(self._settings(min_btn_width=100, language='nl'))
+        
+        self.mock_app.button_manager.refresh_grid.assert_called_once()
+        # The rebuilt grid already has the new labels
+        self.mock_app.button_manager.relabel.assert_not_called()
+        self.mock_app.apply_minimal_mode.assert_not_called()
+    
+    def test_save_settings_minimal_mode_change(self):
+        """Test that a minimal mode change applies it and rebuilds the grid."""
+        self.settings_manager.save_settings(self._settings(minimal_mode=True))
+        
+        self.mock_app.button_manager.refresh_grid.assert_called_once()
+        self.mock_app.apply_minimal_mode.assert_called_once()
+        self.mock_app.after.assert_any_call(200, self.mock_app.force_refresh_minimal_mode)
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
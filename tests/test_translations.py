@@ -0,0 +1,70 @@
+"""Tests for translation management."""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.translations import TranslationManager
+
+
+class TestTranslationCache(unittest.TestCase):
+    """Test cases for the TranslationManager lookup cache."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.translation_manager = TranslationManager()
+        self.translation_manager.translations = {
+            'en': {'Settings': 'Settings'},
+            'nl': {'Settings': 'Instellingen'}
+        }
+    
+    def test_get_text_cached_per_language(self):
+        """Test that lookups are cached per (language, text)."""
+        self.assertEqual(self.translation_manager.get_text('Settings', 'en'), 'Settings')
+        self.assertEqual(self.translation_manager.get_text('Settings', 'nl'), 'Instellingen')
+        
+        self.assertEqual(self.translation_manager._cache[('en', 'Settings')], 'Settings')
+        self.assertEqual(self.translation_manager._cache[('nl', 'Settings')], 'Instellingen')
+        
+        # A cached entry is returned without consulting the translations again
+        with patch.dict(self.translation_manager.translations['en'], {'Settings': 'Changed'}):
+            self.assertEqual(self.translation_manager.get_text('Settings', 'en'), 'Settings')
+    
+    def test_get_text_uses_current_language(self):
+        """Test that a language switch needs no cache invalidation."""
+        self.translation_manager.set_language('en')
+        self.assertEqual(self.translation_manager.get_text('Settings'), 'Settings')
+        
+        self.translation_manager.set_language('nl')
+        self.assertEqual(self.translation_manager.get_text('Settings'), 'Instellingen')
+    
+    def test_get_text_fallback_cached(self):
+        """Test that untranslated text falls back to itself and is cached."""
+        self.assertEqual(self.translation_manager.get_text('Unknown', 'nl'), 'Unknown')
+        self.assertIn(('nl', 'Unknown'), self.translation_manager._cache)
+    
+    def test_load_translations_clears_cache(self):
+        """Test that reloading the translations invalidates the cache."""
+        self.translation_manager.get_text('Settings', 'nl')
+        self.assertTrue(self.translation_manager._cache)
+        
+        self.translation_manager.load_translations()
+        self.assertEqual(self.translation_manager._cache, {})
+    
+    def test_load_translations_failure_clears_cache(self):
+        """Test that the cache is also cleared when loading falls back to empty translations."""
+        self.translation_manager.get_text('Settings', 'nl')
+        
+        with patch('builtins.open', side_effect=OSError('missing')):
+            self.translation_manager.load_translations()
+        
+        self.assertEqual(self.translation_manager._cache, {})
+        self.assertEqual(self.translation_manager.get_text('Settings', 'nl'), 'Settings')
+
+
+if __name__ == '__main__':
+    unittest.main()
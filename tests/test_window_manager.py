@@ -0,0 +1,69 @@
+"""Tests for window management."""
+
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.managers.window_manager import WindowManager, _check_geometry
+
+
+class TestCheckGeometry(unittest.TestCase):
+    """Test cases for the saved geometry check."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        _check_geometry.cache_clear()
+
+    def test_on_screen(self):
+        """Test a window fully on screen."""
+        self.assertTrue(_check_geometry("400x300+100+100", 1920, 1080))
+
+    def test_partially_off_screen_within_tolerance(self):
+        """Test a window slightly off the top-left edge."""
+        self.assertTrue(_check_geometry("400x300+-10+-20", 1920, 1080))
+
+    def test_off_screen(self):
+        """Test windows starting beyond or ending before the screen."""
+        self.assertFalse(_check_geometry("400x300+1920+100", 1920, 1080))
+        self.assertFalse(_check_geometry("400x300+100+1080", 1920, 1080))
+        self.assertFalse(_check_geometry("400x300+-500+100", 1920, 1080))
+
+    def test_too_large(self):
+        """Test a window larger than the screen plus tolerance."""
+        self.assertFalse(_check_geometry("2000x300+0+0", 1920, 1080))
+        self.assertTrue(_check_geometry("1950x300+0+0", 1920, 1080))
+
+    def test_unparseable(self):
+        """Test geometry strings that are not widthxheight+x+y."""
+        self.assertFalse(_check_geometry("", 1920, 1080))
+        self.assertFalse(_check_geometry("400x300", 1920, 1080))
+        self.assertFalse(_check_geometry("400x300+a+b", 1920, 1080))
+
+    def test_memoized_per_screen_size(self):
+        """Test that repeated checks are served from the cache."""
+        _check_geometry("400x300+100+100", 1920, 1080)
+        _check_geometry("400x300+100+100", 1920, 1080)
+        _check_geometry("400x300+100+100", 1280, 720)
+
+        info = _check_geometry.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+
+    def test_is_valid_geometry_uses_screen_size(self):
+        """Test that WindowManager checks against the app's screen size."""
+        mock_app = MagicMock()
+        mock_app.winfo_screenwidth.return_value = 800
+        mock_app.winfo_screenheight.return_value = 600
+        window_manager = WindowManager(mock_app)
+
+        self.assertTrue(window_manager._is_valid_geometry("400x300+100+100"))
+        self.assertFalse(window_manager._is_valid_geometry("400x300+900+100"))
+        self.assertFalse(window_manager._is_valid_geometry(None))
+
+
+if __name__ == '__main__':
+    unittest.main()